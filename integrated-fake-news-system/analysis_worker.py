@@ -0,0 +1,25 @@
+"""
+Analysis Pool Worker Entry Points
+The process pool starts its workers with forkserver or spawn, so they unpickle
+these functions by module name. Workers import only the detector module, never
+the Flask app with its stores, clients and background threads
+"""
+
+from detector import EnhancedFakeNewsDetector
+
+# Detector owned by this worker process, created once by init_worker
+_detector = None
+
+
+def init_worker(sentiment_backend, credibility_file, gazetteer_file):
+    global _detector
+    _detector = EnhancedFakeNewsDetector(
+        sentiment_backend=sentiment_backend,
+        credibility_file=credibility_file,
+        gazetteer_file=gazetteer_file
+    )
+
+
+def analyze_chunk(items):
+    # The parent already answered memo hits, so compute straight away
+    return _detector._compute_batch(items)
@@ -0,0 +1,107 @@
+"""
+Analytics Rollups for Analyzed Articles
+Summaries and CSV export built from the hourly rollup buckets the article store
+maintains, so a report costs O(buckets) however many articles were analyzed
+"""
+
+import csv
+import io
+from datetime import datetime, timezone
+
+CSV_COLUMNS = ('hour', 'region', 'category', 'classification', 'articles', 'average_sentiment', 'average_confidence')
+
+
+class _Tally:
+    """Running counts and means for one group of buckets"""
+
+    __slots__ = ('articles', 'fake', 'real', 'sentiment_sum', 'confidence_sum')
+
+    def __init__(self):
+        self.articles = 0
+        self.fake = 0
+        self.real = 0
+        self.sentiment_sum = 0.0
+        self.confidence_sum = 0.0
+
+    def add(self, classification, articles, sentiment_sum, confidence_sum):
+        self.articles += articles
+        if classification == 'Fake':
+            self.fake += articles
+        elif classification == 'Real':
+            self.real += articles
+        self.sentiment_sum += sentiment_sum
+        self.confidence_sum += confidence_sum
+
+    def to_dict(self):
+        return {
+            'total': self.articles,
+            'fake': self.fake,
+            'real': self.real,
+            'average_sentiment': _mean(self.sentiment_sum, self.articles),
+            'average_confidence': _mean(self.confidence_sum, self.articles)
+        }
+
+
+def _mean(total, count):
+    return round(total / count, 4) if count else None
+
+
+def _hour_iso(hour):
+    return datetime.fromtimestamp(hour, tz=timezone.utc).strftime('%Y-%m-%dT%H:00:00Z')
+
+
+def _period(hour, granularity):
+    if granularity == 'day':
+        return datetime.fromtimestamp(hour, tz=timezone.utc).strftime('%Y-%m-%d')
+    return _hour_iso(hour)
+
+
+def summarize(buckets, granularity='hour'):
+    """
+    Totals plus category, region, classification and timeline breakdowns of
+    rollup buckets, each a (hour, region, category, classification, articles,
+    sentiment_sum, confidence_sum) row; the timeline is per hour or per day (UTC)
+    """
+    totals = _Tally()
+    groups = {'category': {}, 'region': {}, 'classification': {}, 'period': {}}
+
+    for hour, region, category, classification, articles, sentiment_sum, confidence_sum in buckets:
+        values = (classification, articles, sentiment_sum, confidence_sum)
+        totals.add(*values)
+        keys = {
+            'category': category,
+            'region': region,
+            'classification': classification,
+            'period': _period(hour, granularity)
+        }
+        for dimension, key in keys.items():
+            tally = groups[dimension].get(key)
+            if tally is None:
+                tally = groups[dimension][key] = _Tally()
+            tally.add(*values)
+
+    def breakdown(dimension, order_by_total=True):
+        items = groups[dimension].items()
+        items = sorted(items, key=lambda item: -item[1].articles) if order_by_total else sorted(items)
+        return [{dimension: key, **tally.to_dict()} for key, tally in items]
+
+    return {
+        'totals': totals.to_dict(),
+        'by_category': breakdown('category'),
+        'by_region': breakdown('region'),
+        'by_classification': breakdown('classification'),
+        'timeline': breakdown('period', order_by_total=False)
+    }
+
+
+def to_csv(buckets):
+    """The rollup buckets as CSV, one row per hour, region, category and classification"""
+    stream = io.StringIO()
+    writer = csv.writer(stream)
+    writer.writerow(CSV_COLUMNS)
+    for hour, region, category, classification, articles, sentiment_sum, confidence_sum in buckets:
+        writer.writerow((
+            _hour_iso(hour), region, category, classification, articles,
+            _mean(sentiment_sum, articles), _mean(confidence_sum, articles)
+        ))
+    return stream.getvalue()
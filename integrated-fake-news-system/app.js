@@ -560,11 +560,43 @@ function initializeAnalytics() {
   }, 500);
 }
 
+// Server-side rollups of every analyzed article (the sample data above is the offline fallback)
+const ANALYTICS_URL = '/api/analytics';
+const ANALYTICS_HOURS = 24 * 8;
+
+function loadAnalytics() {
+  return fetch(`${ANALYTICS_URL}?hours=${ANALYTICS_HOURS}&granularity=day`)
+    .then(response => {
+      if (!response.ok) throw new Error(`Analytics request failed with status ${response.status}`);
+      return response.json();
+    })
+    .then(report => {
+      // Nothing analyzed yet: keep the sample charts
+      if (report.totals.total === 0) return;
+      
+      appData.analytics = {
+        categoryDistribution: report.by_category.map(d => ({category: d.category, fake: d.fake, real: d.real, total: d.total})),
+        regionDistribution: report.by_region.map(d => ({
+          region: d.region.charAt(0).toUpperCase() + d.region.slice(1),
+          fake: d.fake,
+          real: d.real,
+          total: d.total
+        })),
+        timeSeriesData: report.timeline.map(d => ({date: d.period, fake: d.fake, real: d.real}))
+      };
+    })
+    .catch(error => {
+      console.warn('Analytics API unavailable, showing sample data:', error);
+    });
+}
+
 function initializeAnalyticsCharts() {
   console.log('Initializing analytics charts...');
-  initializeCategoryChart();
-  initializeRegionChart();
-  initializeTimelineChart();
+  loadAnalytics().then(() => {
+    initializeCategoryChart();
+    initializeRegionChart();
+    initializeTimelineChart();
+  });
 }
 
 function initializeCategoryChart() {
@@ -699,6 +731,19 @@ function refreshAnalyticsCharts() {
 
 function exportAnalytics() {
   console.log('Exporting analytics data...');
+  fetch(`${ANALYTICS_URL}?hours=${ANALYTICS_HOURS}&format=csv`)
+    .then(response => {
+      if (!response.ok) throw new Error(`Analytics export failed with status ${response.status}`);
+      return response.blob();
+    })
+    .then(blob => downloadBlob(blob, `fake-news-analytics-${new Date().toISOString().split('T')[0]}.csv`))
+    .catch(error => {
+      console.warn('Analytics API unavailable, exporting sample data:', error);
+      exportSampleAnalytics();
+    });
+}
+
+function exportSampleAnalytics() {
   const data = {
     exportDate: new Date().toISOString(),
     systemMetrics: appData.systemMetrics,
@@ -707,10 +752,14 @@ function exportAnalytics() {
   };
   
   const blob = new Blob([JSON.stringify(data, null, 2)], { type: 'application/json' });
+  downloadBlob(blob, `fake-news-analytics-${new Date().toISOString().split('T')[0]}.json`);
+}
+
+function downloadBlob(blob, filename) {
   const url = URL.createObjectURL(blob);
   const a = document.createElement('a');
   a.href = url;
-  a.download = `fake-news-analytics-${new Date().toISOString().split('T')[0]}.json`;
+  a.download = filename;
   document.body.appendChild(a);
   a.click();
   document.body.removeChild(a);
@@ -0,0 +1,45 @@
+"""
+Compact Article Record
+One fetched news article, shared by every provider and the analysis pipeline
+"""
+
+import sys
+
+
+class Article:
+    """
+    A fetched news article. Slots instead of a per-instance dict, interned
+    source/category strings shared between articles, and a description that is
+    only stored when it differs from the body text.
+    """
+
+    __slots__ = (
+        'title', 'content', '_description', 'url', 'source', 'category', 'published_at',
+        'feed_url', 'guid', 'published_ts', 'data_source'
+    )
+
+    def __init__(self, title, content='', description=None, url='', source='Unknown', category='General',
+                 published_at=None, feed_url=None, guid=None, published_ts=None, data_source='live'):
+        self.title = title or ''
+        self.content = content or description or ''
+        self._description = description if description and description != self.content else None
+        self.url = url or ''
+        self.source = sys.intern(source or 'Unknown')
+        self.category = sys.intern(category or 'General')
+        self.published_at = published_at
+
+        # Set for RSS entries only: where the entry came from, for the feed watermarks
+        self.feed_url = sys.intern(feed_url) if feed_url else None
+        self.guid = guid
+        self.published_ts = published_ts
+
+        # 'sample' for the built-in demo articles served when every upstream fails; never stored
+        self.data_source = data_source
+
+    @property
+    def description(self):
+        """The provider's summary, or the body text when it had no separate summary"""
+        return self._description or self.content
+
+    def __repr__(self):
+        return f"Article(title={self.title!r}, source={self.source!r}, url={self.url!r})"
@@ -0,0 +1,188 @@
+"""
+Memory Benchmark for Fetched Article Records
+Compares the Article record with the plain dicts the news client used to build,
+for the same articles decoded from synthetic GNews and RSS payloads. Both sides
+are built field for field as NewsAPIClient builds them (the dicts as
+_format_gnews_response and _rss_article did before Article).
+
+Usage:
+    python benchmark-articles.py                  # 10000 articles per provider
+    python benchmark-articles.py --count 50000
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import tracemalloc
+from datetime import datetime
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+
+from articles import Article
+
+SOURCES = ['Reuters', 'BBC News', 'The Hindu', 'Times of India', 'NDTV', 'Deccan Herald', 'PIB']
+FEED_URLS = [
+    'https://feeds.feedburner.com/NDTV-LatestNews',
+    'https://timesofindia.indiatimes.com/rssfeedstopstories.cms',
+    'https://feeds.bbci.co.uk/news/world/rss.xml'
+]
+ENTRIES_PER_FEED = 50
+
+
+def _words(rng, count):
+    return ' '.join(f"word{rng.randrange(5000)}" for _ in range(count))
+
+
+def make_gnews_payload(count, seed=7):
+    """A GNews search response body, so every decoded string is a separate object as after a real fetch"""
+    rng = random.Random(seed)
+    return json.dumps({
+        'totalArticles': count,
+        'articles': [
+            {
+                'title': f"Article {index} headline about topic {rng.randrange(500)}",
+                'description': _words(rng, 25),
+                'content': _words(rng, 40),
+                'url': f"https://news.example.com/{index}",
+                'image': f"https://news.example.com/{index}.jpg",
+                'publishedAt': '2026-01-01T00:00:00Z',
+                'source': {'name': rng.choice(SOURCES), 'url': 'https://news.example.com'}
+            }
+            for index in range(count)
+        ]
+    })
+
+
+def make_rss_payload(count, seed=7):
+    """Feeds as _parse_rss_response leaves them: one title per feed, then its entries"""
+    rng = random.Random(seed)
+    feeds = []
+    for index in range(count):
+        if index % ENTRIES_PER_FEED == 0:
+            feeds.append({'url': FEED_URLS[len(feeds) % len(FEED_URLS)], 'title': rng.choice(SOURCES), 'entries': []})
+        feeds[-1]['entries'].append({
+            'guid': f"https://news.example.com/{index}",
+            'published': 1767225600 + index,
+            'entry': {
+                'title': f"Article {index} headline about topic {rng.randrange(500)}",
+                'summary': _words(rng, 40),
+                'link': f"https://news.example.com/{index}",
+                'published': 'Thu, 01 Jan 2026 00:00:00 GMT'
+            }
+        })
+    return json.dumps(feeds)
+
+
+def _parsed_entries(feeds):
+    """(parsed entry, feed URL) pairs, the feed title shared by its entries as feedparser shares it"""
+    for feed in feeds:
+        for parsed in feed['entries']:
+            parsed['source'] = feed['title']
+            yield parsed, feed['url']
+
+
+def gnews_dicts(data):
+    return [
+        {
+            'title': article.get('title', ''),
+            'description': article.get('description', ''),
+            'content': article.get('content', article.get('description', '')),
+            'url': article.get('url', ''),
+            'source': article.get('source', {}).get('name', 'Unknown'),
+            'publishedAt': article.get('publishedAt', datetime.now().isoformat()),
+            'category': 'General'
+        }
+        for article in data['articles']
+    ]
+
+
+def gnews_articles(data):
+    return [
+        Article(
+            title=article.get('title', ''),
+            description=article.get('description', ''),
+            content=article.get('content', article.get('description', '')),
+            url=article.get('url', ''),
+            source=article.get('source', {}).get('name', 'Unknown'),
+            published_at=article.get('publishedAt', datetime.now().isoformat()),
+            category='General'
+        )
+        for article in data['articles']
+    ]
+
+
+def rss_dicts(feeds, category='india'):
+    records = []
+    for parsed, feed_url in _parsed_entries(feeds):
+        entry = parsed['entry']
+        records.append({
+            'title': entry.get('title', ''),
+            'description': entry.get('summary', ''),
+            'content': entry.get('summary', ''),
+            'url': entry.get('link', ''),
+            'source': parsed['source'],
+            'publishedAt': entry.get('published', datetime.now().isoformat()),
+            'category': category.title(),
+            'feed_url': feed_url,
+            'guid': parsed['guid'],
+            'published_ts': parsed['published']
+        })
+    return records
+
+
+def rss_articles(feeds, category='india'):
+    records = []
+    for parsed, feed_url in _parsed_entries(feeds):
+        entry = parsed['entry']
+        records.append(Article(
+            title=entry.get('title', ''),
+            content=entry.get('summary', ''),
+            url=entry.get('link', ''),
+            source=parsed['source'],
+            published_at=entry.get('published', datetime.now().isoformat()),
+            category=category.title(),
+            feed_url=feed_url,
+            guid=parsed['guid'],
+            published_ts=parsed['published']
+        ))
+    return records
+
+
+def measure(build, payload):
+    """Bytes still allocated once the records are built and the decoded payload is dropped"""
+    gc.collect()
+    tracemalloc.start()
+    records = build(json.loads(payload))
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return retained, len(records)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--count', type=int, default=10000, help='articles to build per provider (default: 10000)')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    providers = (
+        ('GNews', make_gnews_payload(args.count, args.seed), gnews_dicts, gnews_articles),
+        ('RSS', make_rss_payload(args.count, args.seed), rss_dicts, rss_articles),
+    )
+    for provider, payload, as_dicts, as_articles in providers:
+        results = {}
+        for name, build in (('dict', as_dicts), ('Article', as_articles)):
+            retained, count = measure(build, payload)
+            results[name] = retained
+            print(f"{provider:<6} {name:<8} {retained / 1024 / 1024:8.2f} MiB  {retained / count:8.0f} bytes/article")
+
+        saved = 1 - results['Article'] / results['dict']
+        print(f"{provider:<6} Article uses {saved:.0%} less memory than dicts for {args.count} articles")
+
+
+if __name__ == '__main__':
+    main()
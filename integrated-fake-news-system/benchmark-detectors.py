@@ -0,0 +1,299 @@
+"""
+Micro-Benchmarks for the Fake News Detector Hot Paths
+Times EnhancedFakeNewsDetector.analyze_article and each of its stages, plus
+ImprovedFakeNewsDetector.enhanced_prediction, on synthetic corpora and compares
+the results against a saved baseline.
+
+Usage:
+    python benchmark-detectors.py                              # run and print a report
+    python benchmark-detectors.py --save-baseline bench.json   # record a baseline
+    python benchmark-detectors.py --compare bench.json         # exit 1 on a regression
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Importing the app must not touch the real article database or start ingestion
+os.environ.setdefault('ARTICLES_DB', os.path.join(tempfile.gettempdir(), 'fake-news-benchmark.db'))
+os.environ.setdefault('INGESTION_ENABLED', '0')
+sys.path.insert(0, HERE)
+
+
+def load_module(name, filename):
+    """Import one of the hyphen-named scripts in this directory"""
+    spec = importlib.util.spec_from_file_location(name, os.path.join(HERE, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+# Words per generated article body
+TEXT_LENGTHS = {'short': 25, 'medium': 150, 'long': 600}
+
+VOCABULARY = (
+    'government minister announced policy budget state district officials report '
+    'city council water supply metro project farmers monsoon election court ruling '
+    'hospital health scheme students university research economy growth market '
+    'police investigation traffic infrastructure digital services public meeting '
+    'said today week year new plan support local national international'
+).split()
+
+PROPER_NOUNS = ['Karnataka', 'Bengaluru', 'Mysuru', 'India', 'Delhi', 'Reuters', 'Parliament', 'Supreme Court']
+
+PHRASES = [
+    'according to', 'sources say', 'study shows', 'reported by', 'shocking', 'unbelievable',
+    'breaking', 'exclusive', 'secret', 'exposed', 'miracle cure', "you won't believe",
+    'doctors hate', 'one weird trick', 'good', 'great', 'terrible', 'not bad', 'very happy'
+]
+
+SOURCES = [
+    'Reuters', 'BBC News', 'The Hindu', 'Times of India', 'NDTV', 'PIB',
+    'Viral News Daily', 'Conspiracy Truth', 'Unknown Blog', None
+]
+
+
+def make_corpus(size, length, seed=7):
+    """Deterministic synthetic articles: (title, content, source)"""
+    rng = random.Random(f"{seed}:{size}:{length}")
+    words_per_body = TEXT_LENGTHS[length]
+    corpus = []
+
+    for _ in range(size):
+        words = []
+        while len(words) < words_per_body:
+            roll = rng.random()
+            if roll < 0.08:
+                words.extend(rng.choice(PHRASES).split())
+            elif roll < 0.16:
+                words.append(rng.choice(PROPER_NOUNS))
+            else:
+                words.append(rng.choice(VOCABULARY))
+            if rng.random() < 0.07:
+                words[-1] += rng.choice(['.', '.', ',', '!'])
+        if rng.random() < 0.1:
+            words = [word.upper() for word in words]
+
+        title_words = [rng.choice(VOCABULARY) for _ in range(rng.randint(5, 10))]
+        title = ' '.join(title_words).capitalize()
+        if rng.random() < 0.2:
+            title = f"{rng.choice(PHRASES).upper()}: {title}!"
+
+        corpus.append((title, ' '.join(words) + '.', rng.choice(SOURCES)))
+
+    return corpus
+
+
+def build_benchmarks(app_module, detector_module, sentiment_backend):
+    """
+    Return {name: (setup, run)}. setup() builds fresh state so every repeat starts
+    with cold caches; run(state, title, content, source) is the timed operation.
+    """
+    def fresh_detector():
+        # A zero-sized memo makes every call do the full analysis
+        detector = app_module.EnhancedFakeNewsDetector(memo_size=0, sentiment_backend=sentiment_backend)
+        # Build the lazily loaded lexicons here, outside the timed loop and the tracemalloc window
+        detector.preload()
+        app_module.load_tables()
+        return detector
+
+    def text_of(title, content):
+        return f"{title} {content}"
+
+    return {
+        'analyze_article': (
+            fresh_detector,
+            lambda d, title, content, source: d.analyze_article(title, content, source)
+        ),
+        'stage.classification': (
+            fresh_detector,
+            lambda d, title, content, source: d._classify_news(text_of(title, content), source)
+        ),
+        'stage.sentiment': (
+            fresh_detector,
+            lambda d, title, content, source: d._analyze_sentiment(text_of(title, content))
+        ),
+        'stage.entities': (
+            fresh_detector,
+            lambda d, title, content, source: d._extract_entities(text_of(title, content))
+        ),
+        'stage.credibility': (
+            fresh_detector,
+            lambda d, title, content, source: d._assess_source_credibility(source)
+        ),
+        'stage.patterns': (
+            fresh_detector,
+            lambda d, title, content, source: d._detect_suspicious_patterns(text_of(title, content))
+        ),
+        'enhanced_prediction': (
+            detector_module.ImprovedFakeNewsDetector,
+            lambda d, title, content, source: d.enhanced_prediction(text_of(title, content), source)
+        ),
+    }
+
+
+def time_benchmark(setup, run, corpus, repeat):
+    """Best wall time over the repeats, each on fresh state"""
+    best = None
+    for _ in range(repeat):
+        state = setup()
+        gc.collect()
+        started = time.perf_counter()
+        for title, content, source in corpus:
+            run(state, title, content, source)
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(setup, run, corpus):
+    """Peak bytes allocated while running once over the corpus (setup excluded)"""
+    state = setup()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for title, content, source in corpus:
+            run(state, title, content, source)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_suite(sizes, lengths, repeat, only=None, sentiment_backend='fast', seed=7):
+    app_module = load_module('enhanced_news_api_app', 'enhanced-news-api-app.py')
+    detector_module = load_module('enhanced_fake_news_detector', 'enhanced-fake-news-detector.py')
+    benchmarks = build_benchmarks(app_module, detector_module, sentiment_backend)
+
+    results = {}
+    for length in lengths:
+        for size in sizes:
+            corpus = make_corpus(size, length, seed)
+            for name, (setup, run) in benchmarks.items():
+                if only and not any(name.startswith(prefix) for prefix in only):
+                    continue
+
+                elapsed = time_benchmark(setup, run, corpus, repeat)
+                results[f"{name}/{length}/{size}"] = {
+                    'ops_per_sec': size / elapsed if elapsed else float('inf'),
+                    'us_per_op': elapsed / size * 1e6,
+                    'peak_kib': peak_memory(setup, run, corpus) / 1024
+                }
+
+    return {
+        'meta': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'sentiment_backend': sentiment_backend,
+            'repeat': repeat,
+            'seed': seed,
+            'created': time.strftime('%Y-%m-%dT%H:%M:%S')
+        },
+        'results': results
+    }
+
+
+def compare(current, baseline, speed_threshold, memory_threshold):
+    """List regressions of current results against a baseline"""
+    regressions = []
+    for key, result in current['results'].items():
+        before = baseline['results'].get(key)
+        if before is None:
+            continue
+
+        slowdown = 1 - result['ops_per_sec'] / before['ops_per_sec']
+        if slowdown > speed_threshold:
+            regressions.append(
+                f"{key}: {result['ops_per_sec']:.0f} ops/s vs {before['ops_per_sec']:.0f} baseline ({slowdown:.0%} slower)"
+            )
+
+        growth = result['peak_kib'] / before['peak_kib'] - 1 if before['peak_kib'] else 0
+        if growth > memory_threshold:
+            regressions.append(
+                f"{key}: peak {result['peak_kib']:.0f} KiB vs {before['peak_kib']:.0f} KiB baseline ({growth:.0%} more)"
+            )
+
+    return regressions
+
+
+def print_report(report, baseline=None):
+    print(f"Sentiment backend: {report['meta']['sentiment_backend']}, "
+          f"best of {report['meta']['repeat']}, Python {report['meta']['python']}")
+    print(f"{'benchmark':<42}{'ops/sec':>12}{'us/op':>12}{'peak KiB':>12}{'vs base':>10}")
+    print('-' * 88)
+
+    for key, result in report['results'].items():
+        change = ''
+        if baseline and key in baseline['results']:
+            change = f"{result['ops_per_sec'] / baseline['results'][key]['ops_per_sec'] - 1:+.0%}"
+        print(f"{key:<42}{result['ops_per_sec']:>12.0f}{result['us_per_op']:>12.1f}"
+              f"{result['peak_kib']:>12.0f}{change:>10}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='100,1000', help='comma-separated corpus sizes (default: 100,1000)')
+    parser.add_argument('--lengths', default='short,medium,long',
+                        help=f"comma-separated text lengths from {', '.join(TEXT_LENGTHS)}")
+    parser.add_argument('--repeat', type=int, default=3, help='timed runs per benchmark; the best is kept')
+    parser.add_argument('--only', help='comma-separated benchmark name prefixes, e.g. stage.,analyze_article')
+    parser.add_argument('--sentiment-backend', default='fast', choices=['fast', 'vader'])
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--save-baseline', metavar='PATH', help='write the results as a baseline')
+    parser.add_argument('--compare', metavar='PATH', help='baseline to check for regressions')
+    parser.add_argument('--threshold', type=float, default=0.15,
+                        help='ops/sec drop that counts as a regression (default: 0.15)')
+    parser.add_argument('--memory-threshold', type=float, default=0.25,
+                        help='peak memory growth that counts as a regression (default: 0.25)')
+    args = parser.parse_args(argv)
+
+    lengths = args.lengths.split(',')
+    unknown = [length for length in lengths if length not in TEXT_LENGTHS]
+    if unknown:
+        parser.error(f"unknown text length: {', '.join(unknown)}")
+
+    report = run_suite(
+        sizes=[int(size) for size in args.sizes.split(',')],
+        lengths=lengths,
+        repeat=args.repeat,
+        only=args.only.split(',') if args.only else None,
+        sentiment_backend=args.sentiment_backend,
+        seed=args.seed
+    )
+
+    baseline = None
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+
+    print_report(report, baseline)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nBaseline saved to {args.save_baseline}")
+
+    if baseline:
+        regressions = compare(report, baseline, args.threshold, args.memory_threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s):")
+            for regression in regressions:
+                print(f"  {regression}")
+            return 1
+        print("\nNo regressions against the baseline")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Near-Duplicate Detection for Fetched Articles
+Syndicated copies of a story are collapsed by normalized URL, by headline, or by
+MinHash similarity of their word shingles
+"""
+
+import hashlib
+import re
+from urllib.parse import urlsplit, parse_qsl, urlencode
+
+import numpy as np
+
+# Query parameters that only track the click and never change the article
+TRACKING_PARAMS = {'fbclid', 'gclid', 'ref', 'ref_src', 'cmpid', 'ito', 'ncid', 'ns_mchannel', 'ns_source'}
+
+_WORD_RE = re.compile(r'\w+')
+
+# " - NDTV", " | Reuters": aggregators and feeds append the publisher to the headline
+_PUBLISHER_SUFFIX_RE = re.compile(r'\s+[-|–—]\s+[^-|–—]{1,60}$')
+
+SHINGLE_WORDS = 3
+MIN_TITLE_WORDS = 5  # shorter headlines ("Live updates") are too generic to identify a story
+NUM_HASHES = 128
+
+# Universal hashing h(x) = (a*x + b) mod p over 31-bit shingle hashes: products stay below 2**62
+_PRIME = (1 << 31) - 1
+_rng = np.random.default_rng(20240517)  # fixed, so signatures are comparable across processes
+_HASH_A = _rng.integers(1, _PRIME, size=NUM_HASHES, dtype=np.uint64)
+_HASH_B = _rng.integers(0, _PRIME, size=NUM_HASHES, dtype=np.uint64)
+
+
+def normalize_url(url):
+    """
+    Canonical form of an article URL: lowercase host without 'www.', no tracking
+    parameters, fragment, trailing slash or AMP suffix, and http/https treated alike
+    """
+    if not url:
+        return ''
+
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith('www.'):
+        host = host[4:]
+
+    path = parts.path.rstrip('/')
+    for suffix in ('/amp', '.amp'):
+        if path.endswith(suffix):
+            path = path[:-len(suffix)].rstrip('/')
+
+    query = urlencode(sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith('utm_') and key.lower() not in TRACKING_PARAMS
+    ))
+
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+def strip_publisher(title):
+    """The headline without a trailing " - Publisher" or " | Publisher" attribution"""
+    return _PUBLISHER_SUFFIX_RE.sub('', (title or '').strip())
+
+
+def shingles(text):
+    """Overlapping SHINGLE_WORDS-word sequences of the lowercased text (the whole text when shorter)"""
+    words = _WORD_RE.findall(text.lower())
+    if len(words) <= SHINGLE_WORDS:
+        return {' '.join(words)} if words else set()
+    return {' '.join(words[start:start + SHINGLE_WORDS]) for start in range(len(words) - SHINGLE_WORDS + 1)}
+
+
+def minhash(text):
+    """NUM_HASHES-slot MinHash signature of the text's shingles; equal slots estimate Jaccard similarity"""
+    values = np.fromiter(
+        (
+            int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=4).digest(), 'big') & _PRIME
+            for shingle in shingles(text)
+        ),
+        dtype=np.uint64
+    )
+    if not len(values):
+        return np.full(NUM_HASHES, _PRIME, dtype=np.uint64)
+    return ((_HASH_A[:, None] * values[None, :] + _HASH_B[:, None]) % _PRIME).min(axis=1)
+
+
+class DuplicateIndex:
+    """
+    Remembers the articles seen so far and reports whether a new one repeats any of them.
+    Signatures are split into bands of rows; articles sharing a band are candidates,
+    and a candidate is a copy when its estimated Jaccard similarity reaches
+    min_similarity. With the default 32 bands of 4 rows, pairs at 0.5 similarity
+    become candidates 87% of the time and pairs at 0.6 99% of the time.
+    """
+
+    def __init__(self, min_similarity=0.5, bands=32):
+        if NUM_HASHES % bands:
+            raise ValueError(f"bands must divide {NUM_HASHES}")
+
+        self.min_similarity = min_similarity
+        self.bands = bands
+        self._rows = NUM_HASHES // bands
+
+        self._urls = set()
+        self._titles = set()
+        self._signatures = []
+        self._buckets = [{} for _ in range(bands)]
+
+    def add(self, article):
+        """Record the article; returns False when it duplicates one already added"""
+        url_key = normalize_url(article.url)
+        if url_key and url_key in self._urls:
+            return False
+
+        title = strip_publisher(article.title)
+        title_words = _WORD_RE.findall(title.lower())
+        title_key = ' '.join(title_words) if len(title_words) >= MIN_TITLE_WORDS else None
+        if title_key in self._titles:
+            return False
+
+        signature = minhash(f"{title} {article.content}")
+        band_keys = [signature[band * self._rows:(band + 1) * self._rows].tobytes() for band in range(self.bands)]
+
+        checked = set()
+        for bucket, key in zip(self._buckets, band_keys):
+            for position in bucket.get(key, ()):
+                if position in checked:
+                    continue
+                checked.add(position)
+                if np.count_nonzero(signature == self._signatures[position]) >= self.min_similarity * NUM_HASHES:
+                    return False
+
+        if url_key:
+            self._urls.add(url_key)
+        if title_key:
+            self._titles.add(title_key)
+        position = len(self._signatures)
+        self._signatures.append(signature)
+        for bucket, key in zip(self._buckets, band_keys):
+            bucket.setdefault(key, []).append(position)
+        return True
@@ -3,18 +3,49 @@ Enhanced Fake News Detection System with Real News API Integration
 Fetches live news from free APIs for Karnataka, India, and International sources
 """
 
-from flask import Flask, request, jsonify, render_template
+import time
+_import_started = time.perf_counter()
+
+from flask import Flask, request, jsonify, render_template, Response, stream_with_context, g
 from flask_cors import CORS
 import requests
+from requests.adapters import HTTPAdapter
 import logging
 from datetime import datetime
 import os
 import re
 import sqlite3
 import json
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
-import time
+import hashlib
+import gzip
+import calendar
+from email.utils import parsedate_to_datetime
+from fast_sentiment import FastSentimentAnalyzer
+import gc
+from dedup import DuplicateIndex
+from articles import Article
+import analytics
+import analysis_worker
+from detector import (
+    ARTICLES_ANALYZED, ANALYSIS_STAGE_SECONDS, ANALYZED_COMPUTED, ANALYZED_MEMO, STARTUP_TIMINGS,
+    AnalysisMemo, EnhancedFakeNewsDetector, LazyResource
+)
+from json_responses import (
+    RepresentationCache, encode_json, parse_fields, project_article, project_payload, representation_etag
+)
+from metrics import MetricsRegistry, CONTENT_TYPE as METRICS_CONTENT_TYPE
+import profiling
+from profiling import ProfileStore, record_span, propagate
+import hmac
+import threading
+import multiprocessing
+try:
+    import fcntl
+except ImportError:  # Windows: no flock, ingestion runs in the only serving process
+    fcntl = None
+from text_features import load_tables
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, wait, FIRST_COMPLETED, TimeoutError as FuturesTimeoutError
+from urllib.parse import urlparse
 
 # Initialize Flask app
 app = Flask(__name__)
@@ -24,20 +55,209 @@ logger = logging.getLogger(__name__)
 
 # Configuration
 app.config['SECRET_KEY'] = 'your-secret-key-here'
+app.config['NEWS_CACHE_TTL'] = int(os.environ.get('NEWS_CACHE_TTL', 300))  # seconds
+app.config['NEWS_CACHE_MAX_STALE'] = int(os.environ.get('NEWS_CACHE_MAX_STALE', 3600))  # seconds
+app.config['ARTICLES_DB'] = os.environ.get('ARTICLES_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'news_articles.db'))
+app.config['INGESTION_ENABLED'] = os.environ.get('INGESTION_ENABLED', '0') == '1'
+app.config['INGESTION_INTERVAL'] = int(os.environ.get('INGESTION_INTERVAL', 300))  # seconds
+app.config['INGESTION_LOCK'] = os.environ.get('INGESTION_LOCK', app.config['ARTICLES_DB'] + '.ingest.lock')  # one ingester per host
+app.config['ANALYSIS_MEMO_SIZE'] = int(os.environ.get('ANALYSIS_MEMO_SIZE', 5000))  # entries
+app.config['ANALYSIS_MEMO_TTL'] = int(os.environ.get('ANALYSIS_MEMO_TTL', 3600))  # seconds
+app.config['MAX_BATCH_SIZE'] = int(os.environ.get('MAX_BATCH_SIZE', 1000))  # articles per request
+# Each serving process has its own pool, so by default the CPUs are split between them
+app.config['ANALYSIS_WORKERS'] = int(os.environ.get(
+    'ANALYSIS_WORKERS', max(1, (os.cpu_count() or 1) // int(os.environ.get('GUNICORN_WORKERS', 1)))
+))  # processes per serving process
+app.config['ANALYSIS_PARALLEL_THRESHOLD'] = int(os.environ.get('ANALYSIS_PARALLEL_THRESHOLD', 200))  # articles
+app.config['ANALYSIS_CHUNK_SIZE'] = int(os.environ.get('ANALYSIS_CHUNK_SIZE', 50))  # articles per task
+app.config['SENTIMENT_BACKEND'] = os.environ.get('SENTIMENT_BACKEND', 'fast')  # 'fast' or 'vader'
+app.config['DEDUP_MIN_SIMILARITY'] = float(os.environ.get('DEDUP_MIN_SIMILARITY', 0.5))  # MinHash Jaccard estimate
+app.config['GNEWS_API_URL'] = os.environ.get('GNEWS_API_URL', 'https://gnews.io/api/v4/search')
+app.config['RSS_FEEDS'] = json.loads(os.environ.get('RSS_FEEDS', 'null'))  # {region: [feed URLs]}, null for the built-in feeds
+app.config['UPSTREAM_HEDGE_DELAY'] = float(os.environ.get('UPSTREAM_HEDGE_DELAY', 1.5))  # seconds
+app.config['UPSTREAM_FETCH_BUDGET'] = float(os.environ.get('UPSTREAM_FETCH_BUDGET', 6.0))  # seconds
+app.config['BREAKER_FAILURE_THRESHOLD'] = int(os.environ.get('BREAKER_FAILURE_THRESHOLD', 3))  # consecutive failures
+app.config['BREAKER_RESET_TIMEOUT'] = float(os.environ.get('BREAKER_RESET_TIMEOUT', 60))  # seconds
+app.config['PRELOAD_RESOURCES'] = os.environ.get('PRELOAD_RESOURCES', '0') == '1'  # set by gunicorn.conf.py
+app.config['PROMETHEUS_MULTIPROC_DIR'] = os.environ.get('PROMETHEUS_MULTIPROC_DIR') or None  # set by gunicorn.conf.py
+app.config['METRICS_PUBLISH_INTERVAL'] = float(os.environ.get('METRICS_PUBLISH_INTERVAL', 5))  # seconds
+app.config['PROFILE_TOKEN'] = os.environ.get('PROFILE_TOKEN', '')  # empty disables request profiling
+app.config['PROFILE_STORE_SIZE'] = int(os.environ.get('PROFILE_STORE_SIZE', 20))  # profiles kept for download
+app.config['GZIP_MIN_SIZE'] = int(os.environ.get('GZIP_MIN_SIZE', 1024))  # bytes; smaller JSON responses are sent as-is
+app.config['GZIP_LEVEL'] = int(os.environ.get('GZIP_LEVEL', 6))  # 1 (fastest) to 9 (smallest)
+app.config['RESPONSE_CACHE_SIZE'] = int(os.environ.get('RESPONSE_CACHE_SIZE', 64))  # encoded region responses kept
+app.config['SOURCE_CREDIBILITY_FILE'] = os.environ.get('SOURCE_CREDIBILITY_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'source-credibility.json'))
+app.config['ENTITY_GAZETTEER_FILE'] = os.environ.get('ENTITY_GAZETTEER_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'entity-gazetteer.json'))
+
+# Operational metrics, exposed in Prometheus text format at /metrics
+metrics = MetricsRegistry(
+    multiprocess_dir=app.config['PROMETHEUS_MULTIPROC_DIR'],
+    publish_interval=app.config['METRICS_PUBLISH_INTERVAL']
+)
+UPSTREAM_FETCH_SECONDS = metrics.histogram(
+    'news_upstream_fetch_seconds', 'Latency of one upstream news request', ('provider',)
+)
+RSS_FEED_FETCH_SECONDS = metrics.histogram(
+    'news_rss_feed_fetch_seconds', 'Latency of one RSS feed request', ('feed',)
+)
+UPSTREAM_ERRORS = metrics.counter(
+    'news_upstream_errors', 'Upstream news requests that failed or were refused by an open circuit', ('provider', 'reason')
+)
+SAMPLE_FALLBACKS = metrics.counter(
+    'news_sample_fallbacks', 'Region fetches answered with demo sample data', ('region',)
+)
+# The detector's own metrics live in detector.py, so analysis pool workers don't import the app
+metrics.register(ARTICLES_ANALYZED)
+metrics.register(ANALYSIS_STAGE_SECONDS)
+REQUEST_SECONDS = metrics.histogram(
+    'http_request_duration_seconds', 'Latency of requests to the app', ('method', 'route', 'status')
+)
+
+def _import_feedparser():
+    import feedparser
+    return feedparser
+
+feedparser_module = LazyResource('feedparser', _import_feedparser)
+
+class RateLimiter:
+    """
+    Token bucket limiting how fast requests are sent to one provider
+    """
+    
+    def __init__(self, rate, burst=1, name='upstream'):
+        self.name = name
+        self.rate = rate  # tokens added per second
+        self.burst = burst  # maximum tokens that can be spent at once
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until the caller may send one request"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            # Reserve a token up front so concurrent callers queue up behind each other
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait > 0:
+            time.sleep(wait)
+            record_span('rate_limit_wait', wait, provider=self.name)
+
+class CircuitBreaker:
+    """
+    Stops calling a provider after repeated failures.
+    Once open, calls are refused until reset_timeout passes; then a single
+    trial call is let through and its outcome closes or re-opens the circuit.
+    """
+    
+    def __init__(self, name, failure_threshold=3, reset_timeout=60.0):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+        self._lock = threading.Lock()
+    
+    def is_open(self):
+        """Whether calls are currently being refused outright"""
+        with self._lock:
+            return self._opened_at is not None and (
+                self._probing or time.monotonic() - self._opened_at < self.reset_timeout
+            )
+    
+    def allow(self):
+        """Whether the caller may send a request now"""
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if not self._probing and time.monotonic() - self._opened_at >= self.reset_timeout:
+                self._probing = True
+                return True
+            return False
+    
+    def record_success(self):
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info(f"Circuit for {self.name} closed")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            self._probing = False
+            if self._failures >= self.failure_threshold:
+                if self._opened_at is None:
+                    logger.warning(f"Circuit for {self.name} opened after {self._failures} failures")
+                self._opened_at = time.monotonic()
+    
+    def stats(self):
+        with self._lock:
+            return {
+                'state': 'closed' if self._opened_at is None else ('half-open' if self._probing else 'open'),
+                'consecutive_failures': self._failures
+            }
 
 class NewsAPIClient:
     """
     Client for fetching news from free APIs
     """
     
-    def __init__(self):
+    # Search queries, limits and demo fallback for each region
+    REGION_SPECS = {
+        'karnataka': {
+            'queries': [
+                'Karnataka Bangalore news',
+                'Mysore Hubli Karnataka',
+                'Karnataka government'
+            ],
+            'country': 'in',
+            'per_query': 3,
+            'rss_max': 8,
+            'sample': '_get_sample_karnataka_news'
+        },
+        'india': {
+            'queries': [
+                'India news',
+                'Mumbai Delhi Bangalore',
+                'Indian government',
+                'Bollywood India'
+            ],
+            'country': 'in',
+            'per_query': 5,
+            'rss_max': 10,
+            'sample': '_get_sample_indian_news'
+        },
+        'international': {
+            'queries': [
+                'world news',
+                'United States Europe',
+                'global economy',
+                'international politics'
+            ],
+            'country': None,
+            'per_query': 5,
+            'rss_max': 10,
+            'sample': '_get_sample_international_news'
+        }
+    }
+    QUERIES_PER_REGION = 2  # Limit queries to avoid rate limits
+    
+    def __init__(self, dedup_similarity=0.5, watermarks=None, hedge_delay=1.5, fetch_budget=6.0,
+                 breaker_failures=3, breaker_reset=60.0, gnews_base=None, rss_feeds=None):
         # Free API endpoints (no key required for basic usage)
-        self.gnews_base = "https://gnews.io/api/v4/search"
+        self.gnews_base = gnews_base or "https://gnews.io/api/v4/search"
         self.newsdata_base = "https://newsdata.io/api/1/news"
         self.currents_base = "https://api.currentsapi.services/v1/search"
         
         # Backup: Use RSS feeds if APIs are down
-        self.rss_feeds = {
+        self.rss_feeds = rss_feeds or {
             'india': [
                 'https://feeds.feedburner.com/NDTV-LatestNews',
                 'https://timesofindia.indiatimes.com/rssfeedstopstories.cms',
@@ -53,9 +273,121 @@ class NewsAPIClient:
                 'https://feeds.reuters.com/reuters/topNews',
             ]
         }
+        
+        # Per-provider rate limits replace fixed sleeps between queries
+        self.rate_limiters = {
+            'gnews': RateLimiter(rate=1.0, burst=4, name='gnews'),
+            'rss': RateLimiter(rate=10.0, burst=10, name='rss'),
+        }
+        
+        # Shared pool used to fan out all upstream calls for a region at once
+        self.executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='news-fetch')
+        
+        # Keep-alive sessions per host, plus validators from the last 200 response per URL
+        self._sessions = {}
+        self._session_lock = threading.Lock()
+        self._conditional_cache = {}
+        
+        # Syndicated copies of a story at least this similar (shingle Jaccard) are dropped
+        self.dedup_similarity = dedup_similarity
+        
+        # Per-feed record of entries already ingested (see FeedWatermarks)
+        self.watermarks = watermarks
+        
+        # RSS starts once GNews is this slow; a region fetch waits no longer than the budget
+        self.hedge_delay = hedge_delay
+        self.fetch_budget = fetch_budget
+        
+        # One circuit breaker for GNews and one per RSS feed, created on first use
+        self._breaker_settings = {'failure_threshold': breaker_failures, 'reset_timeout': breaker_reset}
+        self._breakers = {}
+        self._breaker_lock = threading.Lock()
+    
+    def _session_for(self, url):
+        """Return the pooled session for the URL's host, creating it on first use"""
+        host = urlparse(url).netloc
+        
+        with self._session_lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=8)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[host] = session
+        
+        return session
+    
+    def breaker_for(self, provider):
+        """Return the circuit breaker for a provider ('gnews' or an RSS feed URL)"""
+        with self._breaker_lock:
+            breaker = self._breakers.get(provider)
+            if breaker is None:
+                breaker = CircuitBreaker(provider, **self._breaker_settings)
+                self._breakers[provider] = breaker
+            return breaker
+    
+    def breaker_stats(self):
+        with self._breaker_lock:
+            breakers = dict(self._breakers)
+        return {provider: breaker.stats() for provider, breaker in breakers.items()}
+    
+    def _conditional_get(self, url, parse, params=None, timeout=10, provider='gnews'):
+        """
+        GET a URL, sending the ETag/Last-Modified stored from its last 200 response.
+        A 304 returns the previously parsed result without downloading or parsing the body.
+        Returns (status_code, parsed result or None).
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        cached = self._conditional_cache.get(key)
+        
+        headers = {}
+        if cached:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+        
+        started = time.perf_counter()
+        status = None
+        try:
+            response = self._session_for(url).get(url, params=params, headers=headers, timeout=timeout)
+            status = response.status_code
+        finally:
+            elapsed = time.perf_counter() - started
+            UPSTREAM_FETCH_SECONDS.observe(elapsed, provider=provider)
+            if provider == 'rss':
+                RSS_FEED_FETCH_SECONDS.observe(elapsed, feed=url)
+            record_span('upstream_fetch', elapsed, provider=provider, url=url, status=status)
+        
+        if response.status_code == 304 and cached:
+            return 304, list(cached['result'])
+        
+        if response.status_code != 200:
+            return response.status_code, None
+        
+        started = time.perf_counter()
+        result = parse(response)
+        record_span('upstream_parse', time.perf_counter() - started, provider=provider, url=url)
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            self._conditional_cache[key] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'result': result
+            }
+        
+        return 200, list(result)
     
     def fetch_news_gnews(self, query, country=None, lang='en', max_articles=20):
         """Fetch news from GNews API (free tier available)"""
+        breaker = self.breaker_for('gnews')
+        if not breaker.allow():
+            UPSTREAM_ERRORS.inc(provider='gnews', reason='circuit_open')
+            return []
+        
         try:
             params = {
                 'q': query,
@@ -69,407 +401,1459 @@ class NewsAPIClient:
             # Note: For production, you'd add your API key here
             # params['apikey'] = 'your-gnews-api-key'
             
-            response = requests.get(self.gnews_base, params=params, timeout=10)
+            self.rate_limiters['gnews'].acquire()
+            status, articles = self._conditional_get(
+                self.gnews_base,
+                lambda response: self._format_gnews_response(response.json()),
+                params=params
+            )
             
-            if response.status_code == 200:
-                data = response.json()
-                return self._format_gnews_response(data)
+            if articles is not None:
+                breaker.record_success()
+                return articles
             else:
-                logger.warning(f"GNews API returned status {response.status_code}")
+                breaker.record_failure()
+                UPSTREAM_ERRORS.inc(provider='gnews', reason='status')
+                logger.warning(f"GNews API returned status {status}")
                 return []
                 
         except Exception as e:
+            breaker.record_failure()
+            UPSTREAM_ERRORS.inc(provider='gnews', reason='exception')
             logger.error(f"Error fetching from GNews: {str(e)}")
             return []
     
-    def fetch_indian_news(self, category='general', max_articles=15):
+    def fetch_indian_news(self, category='general', max_articles=15, only_new=False, fetched=None):
         """Fetch Indian news articles"""
         try:
-            # Try multiple approaches for Indian news
-            articles = []
-            
-            # Approach 1: Search for India-specific terms
-            indian_queries = [
-                'India news',
-                'Mumbai Delhi Bangalore',
-                'Indian government',
-                'Bollywood India'
-            ]
-            
-            for query in indian_queries[:2]:  # Limit queries to avoid rate limits
-                news = self.fetch_news_gnews(query, country='in', max_articles=5)
-                articles.extend(news)
-                time.sleep(1)  # Rate limiting
-            
-            # Approach 2: Fallback to RSS feeds
-            if len(articles) < 5:
-                rss_articles = self._fetch_from_rss('india', max_articles=10)
-                articles.extend(rss_articles)
-            
-            return articles[:max_articles]
+            return self._fetch_region('india', max_articles=max_articles, only_new=only_new, fetched=fetched)
             
         except Exception as e:
             logger.error(f"Error fetching Indian news: {str(e)}")
+            SAMPLE_FALLBACKS.inc(region='india')
             return self._get_sample_indian_news()
     
-    def fetch_karnataka_news(self, max_articles=10):
+    def fetch_karnataka_news(self, max_articles=10, only_new=False, fetched=None):
         """Fetch Karnataka-specific news"""
         try:
-            articles = []
-            
-            # Karnataka-specific searches
-            karnataka_queries = [
-                'Karnataka Bangalore news',
-                'Mysore Hubli Karnataka',
-                'Karnataka government'
-            ]
-            
-            for query in karnataka_queries[:2]:
-                news = self.fetch_news_gnews(query, country='in', max_articles=3)
-                articles.extend(news)
-                time.sleep(1)
-            
-            # Fallback to RSS
-            if len(articles) < 5:
-                rss_articles = self._fetch_from_rss('karnataka', max_articles=8)
-                articles.extend(rss_articles)
-            
-            return articles[:max_articles]
+            return self._fetch_region('karnataka', max_articles=max_articles, only_new=only_new, fetched=fetched)
             
         except Exception as e:
             logger.error(f"Error fetching Karnataka news: {str(e)}")
+            SAMPLE_FALLBACKS.inc(region='karnataka')
             return self._get_sample_karnataka_news()
     
-    def fetch_international_news(self, max_articles=15):
+    def fetch_international_news(self, max_articles=15, only_new=False, fetched=None):
         """Fetch international news"""
         try:
-            articles = []
-            
-            # International queries
-            international_queries = [
-                'world news',
-                'United States Europe',
-                'global economy',
-                'international politics'
-            ]
-            
-            for query in international_queries[:2]:
-                news = self.fetch_news_gnews(query, max_articles=5)
-                articles.extend(news)
-                time.sleep(1)
-            
-            # Fallback to RSS
-            if len(articles) < 5:
-                rss_articles = self._fetch_from_rss('international', max_articles=10)
-                articles.extend(rss_articles)
-            
-            return articles[:max_articles]
+            return self._fetch_region('international', max_articles=max_articles, only_new=only_new, fetched=fetched)
             
         except Exception as e:
             logger.error(f"Error fetching international news: {str(e)}")
+            SAMPLE_FALLBACKS.inc(region='international')
             return self._get_sample_international_news()
     
-    def _fetch_from_rss(self, category, max_articles=10):
-        """Fetch news from RSS feeds as fallback"""
+    def iter_region_news(self, region, max_articles=15):
+        """Yield a region's articles as soon as each upstream call returns"""
+        spec = self.REGION_SPECS[region]
+        seen = DuplicateIndex(min_similarity=self.dedup_similarity)
+        sent = 0
+        rss_sent = 0
+        
         try:
-            import feedparser
-            articles = []
-            
-            feeds = self.rss_feeds.get(category, [])
-            
-            for feed_url in feeds[:2]:  # Limit to 2 feeds to avoid slowdown
-                try:
-                    feed = feedparser.parse(feed_url)
-                    for entry in feed.entries[:5]:  # 5 articles per feed
-                        articles.append({
-                            'title': entry.get('title', ''),
-                            'description': entry.get('summary', ''),
-                            'content': entry.get('summary', ''),
-                            'url': entry.get('link', ''),
-                            'source': feed.feed.get('title', 'RSS Feed'),
-                            'publishedAt': entry.get('published', datetime.now().isoformat()),
-                            'category': category.title()
-                        })
-                except Exception as e:
-                    logger.warning(f"Error parsing RSS feed {feed_url}: {str(e)}")
-                    continue
+            for kind, _, articles in self._iter_region_batches(region):
+                articles = [article for article in articles if seen.add(article)]
+                if kind == 'rss':
+                    articles = articles[:max(0, spec['rss_max'] - rss_sent)]
+                    rss_sent += len(articles)
+                
+                for article in articles:
+                    if sent >= max_articles:
+                        return
+                    sent += 1
+                    yield article
+                    
+        except Exception as e:
+            logger.error(f"Error streaming {region} news: {str(e)}")
+            if sent == 0:
+                SAMPLE_FALLBACKS.inc(region=region)
+                yield from getattr(self, spec['sample'])()[:max_articles]
+    
+    def _fetch_region(self, region, max_articles=15, only_new=False, fetched=None):
+        """
+        Send every GNews query and RSS feed for a region concurrently.
+        RSS results are only used when the queries return fewer than 5 articles,
+        so the call takes about as long as the slowest single upstream request.
+        With only_new, RSS entries already marked ingested are skipped.
+        Every RSS article the feeds returned, including copies and ones past the
+        article limits, is appended to fetched when given, for mark_ingested.
+        """
+        batches = {'gnews': [], 'rss': []}
+        for kind, position, articles in self._iter_region_batches(region, only_new=only_new):
+            batches[kind].append((position, articles))
+        
+        # Keep query and feed order regardless of which call finished first
+        def in_order(kind):
+            return [
+                article
+                for _, articles in sorted(batches[kind], key=lambda batch: batch[0])
+                for article in articles
+            ]
+        
+        fetched_rss = in_order('rss')
+        if fetched is not None:
+            fetched.extend(fetched_rss)
+        
+        # Drop copies of a story already returned by another query or feed
+        seen = DuplicateIndex(min_similarity=self.dedup_similarity)
+        articles = [article for article in in_order('gnews') if seen.add(article)]
+        rss_articles = [article for article in fetched_rss if seen.add(article)]
+        articles.extend(rss_articles[:self.REGION_SPECS[region]['rss_max']])
+        
+        return articles[:max_articles]
+    
+    def _iter_region_batches(self, region, only_new=False):
+        """
+        Yield ('gnews' | 'rss', position, articles) as each upstream call for a region completes.
+        RSS feeds are only yielded when the queries returned fewer than 5 articles.
+        They are started when GNews's circuit is open, when the queries are still
+        running after hedge_delay, or when the queries came back short. Queries
+        still running when the fetch budget runs out are abandoned.
+        """
+        spec = self.REGION_SPECS[region]
+        started = time.monotonic()
+        deadline = started + self.fetch_budget
+        
+        gnews_futures = {}
+        if not self.breaker_for('gnews').is_open():
+            gnews_futures = {
+                self.executor.submit(propagate(self.fetch_news_gnews), query, country=spec['country'], max_articles=spec['per_query']): position
+                for position, query in enumerate(spec['queries'][:self.QUERIES_PER_REGION])
+            }
+        rss_futures = {}
+        
+        def start_rss():
+            rss_futures.update({
+                self.executor.submit(propagate(self._fetch_rss_feed), feed_url, region, only_new): position
+                for position, feed_url in enumerate(self.rss_feeds.get(region, [])[:2])  # Limit to 2 feeds to avoid slowdown
+            })
+        
+        if not gnews_futures:
+            start_rss()
+        
+        gnews_count = 0
+        pending = set(gnews_futures)
+        while pending:
+            # Wait until the hedge point first, then until the overall deadline
+            until = deadline if rss_futures else started + self.hedge_delay
+            done, pending = wait(pending, timeout=max(0, until - time.monotonic()), return_when=FIRST_COMPLETED)
             
-            return articles[:max_articles]
+            for future in done:
+                articles = future.result()
+                gnews_count += len(articles)
+                yield 'gnews', gnews_futures[future], articles
             
+            if not done:
+                if rss_futures:
+                    logger.warning(f"Abandoned {len(pending)} slow GNews queries for {region}")
+                    break
+                start_rss()
+        
+        if gnews_count >= 5:
+            for future in rss_futures:
+                future.cancel()
+            return
+        
+        if not rss_futures:
+            start_rss()
+        
+        try:
+            for future in as_completed(rss_futures, timeout=max(0, deadline - time.monotonic())):
+                yield 'rss', rss_futures[future], future.result()
+        except FuturesTimeoutError:
+            logger.warning(f"RSS feeds for {region} exceeded the {self.fetch_budget}s fetch budget")
+    
+    def _fetch_rss_feed(self, feed_url, category, only_new=False):
+        """
+        Fetch up to 5 articles from a single RSS feed.
+        With only_new, entries the feed's watermark shows as ingested are skipped
+        before any article dicts are built.
+        """
+        try:
+            feedparser = feedparser_module.get()
         except ImportError:
             logger.warning("feedparser not available, using sample data")
             return []
+        
+        breaker = self.breaker_for(feed_url)
+        if not breaker.allow():
+            UPSTREAM_ERRORS.inc(provider='rss', reason='circuit_open')
+            return []
+        
+        try:
+            self.rate_limiters['rss'].acquire()
+            status, entries = self._conditional_get(
+                feed_url,
+                lambda response: self._parse_rss_response(feedparser, response),
+                provider='rss'
+            )
+            
+            if entries is None:
+                breaker.record_failure()
+                UPSTREAM_ERRORS.inc(provider='rss', reason='status')
+                logger.warning(f"RSS feed {feed_url} returned status {status}")
+                return []
+            
+            breaker.record_success()
+            
+            if only_new and self.watermarks is not None:
+                entries = [
+                    entry for entry in entries
+                    if self.watermarks.is_new(feed_url, entry['guid'], entry['published'])
+                ]
+            
+            return [
+                self._rss_article(entry, feed_url, category)
+                for entry in entries[:5]  # 5 articles per feed
+            ]
         except Exception as e:
-            logger.error(f"Error in RSS fallback: {str(e)}")
+            breaker.record_failure()
+            UPSTREAM_ERRORS.inc(provider='rss', reason='exception')
+            logger.warning(f"Error parsing RSS feed {feed_url}: {str(e)}")
             return []
     
+    def _parse_rss_response(self, feedparser, response):
+        """Parse a downloaded RSS feed into its entries, newest first as the feed lists them"""
+        headers = {key.lower(): value for key, value in response.headers.items()}
+        headers.setdefault('content-location', response.url)
+        feed = feedparser.parse(response.content, response_headers=headers)
+        
+        source = feed.feed.get('title', 'RSS Feed')
+        entries = []
+        for entry in feed.entries:
+            published_parsed = entry.get('published_parsed')
+            entries.append({
+                'guid': entry.get('id') or entry.get('link') or entry.get('title', ''),
+                'published': calendar.timegm(published_parsed) if published_parsed else None,
+                'entry': entry,
+                'source': source
+            })
+        
+        return entries
+    
+    def mark_ingested(self, articles):
+        """Advance the feed watermarks past the RSS articles fetched for a processed batch"""
+        if self.watermarks is None:
+            return
+        
+        by_feed = {}
+        for article in articles:
+            if article.feed_url is not None:
+                by_feed.setdefault(article.feed_url, []).append((article.guid, article.published_ts))
+        
+        for feed_url, entries in by_feed.items():
+            self.watermarks.mark_seen(feed_url, entries)
+    
+    def _rss_article(self, parsed, feed_url, category):
+        """Build the Article for one parsed RSS entry"""
+        entry = parsed['entry']
+        return Article(
+            title=entry.get('title', ''),
+            content=entry.get('summary', ''),
+            url=entry.get('link', ''),
+            source=parsed['source'],
+            published_at=entry.get('published', datetime.now().isoformat()),
+            category=category.title(),
+            feed_url=feed_url,
+            guid=parsed['guid'],
+            published_ts=parsed['published']
+        )
+    
     def _format_gnews_response(self, data):
         """Format GNews API response"""
         articles = []
         
         if 'articles' in data:
             for article in data['articles']:
-                articles.append({
-                    'title': article.get('title', ''),
-                    'description': article.get('description', ''),
-                    'content': article.get('content', article.get('description', '')),
-                    'url': article.get('url', ''),
-                    'source': article.get('source', {}).get('name', 'Unknown'),
-                    'publishedAt': article.get('publishedAt', datetime.now().isoformat()),
-                    'category': 'General'
-                })
+                articles.append(Article(
+                    title=article.get('title', ''),
+                    description=article.get('description', ''),
+                    content=article.get('content', article.get('description', '')),
+                    url=article.get('url', ''),
+                    source=article.get('source', {}).get('name', 'Unknown'),
+                    published_at=article.get('publishedAt', datetime.now().isoformat()),
+                    category='General'
+                ))
         
         return articles
     
     def _get_sample_indian_news(self):
         """Sample Indian news for demo"""
         return [
-            {
-                'title': 'Prime Minister Announces New Digital India Initiative',
-                'content': 'The Prime Minister today announced a comprehensive new Digital India initiative aimed at improving internet connectivity across rural areas...',
-                'source': 'Press Information Bureau',
-                'category': 'Politics',
-                'publishedAt': datetime.now().isoformat(),
-                'url': 'https://example.com/digital-india'
-            },
-            {
-                'title': 'Mumbai Metro Expansion Project Approved',
-                'content': 'The Maharashtra government has approved the expansion of Mumbai Metro network to cover additional 100 kilometers...',
-                'source': 'Times of India',
-                'category': 'Infrastructure',
-                'publishedAt': datetime.now().isoformat(),
-                'url': 'https://example.com/mumbai-metro'
-            },
-            {
-                'title': 'Indian Cricket Team Wins Series Against Australia',
-                'content': 'The Indian cricket team secured a historic 3-1 series win against Australia in the recently concluded test series...',
-                'source': 'ESPN Cricinfo',
-                'category': 'Sports',
-                'publishedAt': datetime.now().isoformat(),
-                'url': 'https://example.com/cricket-series'
-            }
+            Article(
+                title='Prime Minister Announces New Digital India Initiative',
+                content='The Prime Minister today announced a comprehensive new Digital India initiative aimed at improving internet connectivity across rural areas...',
+                source='Press Information Bureau',
+                category='Politics',
+                published_at=datetime.now().isoformat(),
+                url='https://example.com/digital-india',
+                data_source='sample'
+            ),
+            Article(
+                title='Mumbai Metro Expansion Project Approved',
+                content='The Maharashtra government has approved the expansion of Mumbai Metro network to cover additional 100 kilometers...',
+                source='Times of India',
+                category='Infrastructure',
+                published_at=datetime.now().isoformat(),
+                url='https://example.com/mumbai-metro',
+                data_source='sample'
+            ),
+            Article(
+                title='Indian Cricket Team Wins Series Against Australia',
+                content='The Indian cricket team secured a historic 3-1 series win against Australia in the recently concluded test series...',
+                source='ESPN Cricinfo',
+                category='Sports',
+                published_at=datetime.now().isoformat(),
+                url='https://example.com/cricket-series',
+                data_source='sample'
+            )
         ]
     
     def _get_sample_karnataka_news(self):
         """Sample Karnataka news for demo"""
         return [
-            {
-                'title': 'Bangalore IT Sector Reports 15% Growth This Quarter',
-                'content': 'The Information Technology sector in Bangalore has reported a significant 15% growth this quarter, driven by increased demand for digital services...',
-                'source': 'The Hindu',
-                'category': 'Technology',
-                'publishedAt': datetime.now().isoformat(),
-                'url': 'https://example.com/bangalore-it-growth'
-            },
-            {
-                'title': 'Karnataka Government Launches New Education Policy',
-                'content': 'The Karnataka state government has launched a comprehensive new education policy focusing on skill development and digital learning...',
-                'source': 'Deccan Herald',
-                'category': 'Education',
-                'publishedAt': datetime.now().isoformat(),
-                'url': 'https://example.com/karnataka-education'
-            },
-            {
-                'title': 'Mysore Palace Tourism Sees Record Visitors',
-                'content': 'Mysore Palace has recorded the highest number of tourists this year, with over 2 million visitors in the past six months...',
-                'source': 'Karnataka Tourism',
-                'category': 'Tourism',
-                'publishedAt': datetime.now().isoformat(),
-                'url': 'https://example.com/mysore-palace-tourism'
-            }
+            Article(
+                title='Bangalore IT Sector Reports 15% Growth This Quarter',
+                content='The Information Technology sector in Bangalore has reported a significant 15% growth this quarter, driven by increased demand for digital services...',
+                source='The Hindu',
+                category='Technology',
+                published_at=datetime.now().isoformat(),
+                url='https://example.com/bangalore-it-growth',
+                data_source='sample'
+            ),
+            Article(
+                title='Karnataka Government Launches New Education Policy',
+                content='The Karnataka state government has launched a comprehensive new education policy focusing on skill development and digital learning...',
+                source='Deccan Herald',
+                category='Education',
+                published_at=datetime.now().isoformat(),
+                url='https://example.com/karnataka-education',
+                data_source='sample'
+            ),
+            Article(
+                title='Mysore Palace Tourism Sees Record Visitors',
+                content='Mysore Palace has recorded the highest number of tourists this year, with over 2 million visitors in the past six months...',
+                source='Karnataka Tourism',
+                category='Tourism',
+                published_at=datetime.now().isoformat(),
+                url='https://example.com/mysore-palace-tourism',
+                data_source='sample'
+            )
         ]
     
     def _get_sample_international_news(self):
         """Sample international news for demo"""
         return [
-            {
-                'title': 'Global Climate Summit Reaches Historic Agreement',
-                'content': 'World leaders at the Global Climate Summit have reached a historic agreement to reduce carbon emissions by 50% over the next decade...',
-                'source': 'BBC News',
-                'category': 'Environment',
-                'publishedAt': datetime.now().isoformat(),
-                'url': 'https://example.com/climate-summit'
-            },
-            {
-                'title': 'Tech Giants Announce AI Safety Initiative',
-                'content': 'Major technology companies have announced a collaborative initiative to develop safety standards for artificial intelligence systems...',
-                'source': 'Reuters',
-                'category': 'Technology',
-                'publishedAt': datetime.now().isoformat(),
-                'url': 'https://example.com/ai-safety-initiative'
-            },
-            {
-                'title': 'European Space Agency Launches Mars Mission',
-                'content': 'The European Space Agency successfully launched its latest Mars exploration mission, marking a significant milestone in space exploration...',
-                'source': 'CNN',
-                'category': 'Science',
-                'publishedAt': datetime.now().isoformat(),
-                'url': 'https://example.com/mars-mission'
-            }
+            Article(
+                title='Global Climate Summit Reaches Historic Agreement',
+                content='World leaders at the Global Climate Summit have reached a historic agreement to reduce carbon emissions by 50% over the next decade...',
+                source='BBC News',
+                category='Environment',
+                published_at=datetime.now().isoformat(),
+                url='https://example.com/climate-summit',
+                data_source='sample'
+            ),
+            Article(
+                title='Tech Giants Announce AI Safety Initiative',
+                content='Major technology companies have announced a collaborative initiative to develop safety standards for artificial intelligence systems...',
+                source='Reuters',
+                category='Technology',
+                published_at=datetime.now().isoformat(),
+                url='https://example.com/ai-safety-initiative',
+                data_source='sample'
+            ),
+            Article(
+                title='European Space Agency Launches Mars Mission',
+                content='The European Space Agency successfully launched its latest Mars exploration mission, marking a significant milestone in space exploration...',
+                source='CNN',
+                category='Science',
+                published_at=datetime.now().isoformat(),
+                url='https://example.com/mars-mission',
+                data_source='sample'
+            )
         ]
 
-class EnhancedFakeNewsDetector:
-    """Enhanced fake news detector with temporal awareness"""
+class RegionCache:
+    """
+    Region-level response cache with stale-while-revalidate.
+    Fresh entries are served as-is. Stale entries are served immediately while
+    one background thread reloads them; entries past max_stale are reloaded inline.
+    """
     
-    def __init__(self):
-        self.current_year = 2025
-        self.sentiment_analyzer = SentimentIntensityAnalyzer()
+    def __init__(self, loader, ttl=300, max_stale=3600):
+        self.loader = loader
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self._entries = {}  # key -> (value, stored_at)
+        self._refreshing = set()
+        self._streams = {}  # key -> RegionStream of the load in progress
+        self._lock = threading.Lock()
+        self._key_locks = {}
+    
+    def get(self, key):
+        """Return (value, status) where status is 'hit', 'stale' or 'miss'"""
+        with self._lock:
+            entry = self._entries.get(key)
         
-    def analyze_article(self, title, content, source):
-        """Comprehensive analysis of a news article"""
-        full_text = f"{title} {content}"
+        cached = self._serve(key, entry)
+        if cached is not None:
+            return cached
         
-        # Fake news classification
-        classification_result = self._classify_news(full_text, source)
+        return self._load(key, entry), 'miss'
+    
+    def peek(self, key):
+        """Like get, but returns None instead of loading a missing entry"""
+        with self._lock:
+            entry = self._entries.get(key)
         
-        # Sentiment analysis
-        sentiment_result = self._analyze_sentiment(full_text)
+        return self._serve(key, entry)
+    
+    def stream(self, key, produce, replay):
+        """
+        Join the streaming load of a key, starting it when none is running.
+        produce(key) is a generator that yields items and returns the value to cache;
+        it runs once in a background thread however many clients follow it, and
+        holds the key's lock so concurrent get() misses wait for it instead of loading.
+        When an inline load finished first, replay(value) supplies the items instead.
+        """
+        with self._lock:
+            flight = self._streams.get(key)
+            if flight is not None:
+                return flight
+            flight = self._streams[key] = RegionStream()
         
-        # Extract entities
-        entities = self._extract_entities(full_text)
+        def run():
+            value = None
+            try:
+                with self._key_lock(key):
+                    with self._lock:
+                        entry = self._entries.get(key)
+                    if entry is not None and time.monotonic() - entry[1] <= self.ttl:
+                        value = entry[0]
+                        for item in replay(value):
+                            flight.append(item)
+                        return
+                    
+                    items = produce(key)
+                    while True:
+                        try:
+                            flight.append(next(items))
+                        except StopIteration as stop:
+                            value = stop.value
+                            break
+                    with self._lock:
+                        self._entries[key] = (value, time.monotonic())
+            except Exception as e:
+                logger.error(f"Error streaming news for {key}: {str(e)}")
+            finally:
+                with self._lock:
+                    self._streams.pop(key, None)
+                flight.finish(value)
         
-        # Source credibility
-        credibility = self._assess_source_credibility(source)
+        threading.Thread(target=run, name=f'stream-{key}', daemon=True).start()
+        return flight
+    
+    def _serve(self, key, entry):
+        if entry is None:
+            return None
         
-        # Suspicious patterns
-        patterns = self._detect_suspicious_patterns(full_text)
+        value, stored_at = entry
+        age = time.monotonic() - stored_at
+        if age <= self.ttl:
+            return value, 'hit'
+        if age <= self.max_stale:
+            self._refresh_in_background(key)
+            return value, 'stale'
         
-        return {
-            'title': title,
-            'classification': classification_result['classification'],
-            'confidence': classification_result['confidence'],
-            'reasoning': classification_result['reasoning'],
-            'sentiment': sentiment_result['label'],
-            'sentiment_score': sentiment_result['score'],
-            'credibility_score': credibility,
-            'entities': entities,
-            'suspicious_patterns': patterns,
-            'source': source
-        }
+        return None
+    
+    def _key_lock(self, key):
+        with self._lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+    
+    def _load(self, key, seen_entry):
+        """Load an entry inline, letting concurrent misses for the same key wait for one load"""
+        with self._key_lock(key):
+            with self._lock:
+                entry = self._entries.get(key)
+            
+            # Another request already reloaded it while we waited
+            if entry is not None and entry is not seen_entry:
+                return entry[0]
+            
+            value = self.loader(key)
+            with self._lock:
+                self._entries[key] = (value, time.monotonic())
+            return value
+    
+    def _refresh_in_background(self, key):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+        
+        def refresh():
+            try:
+                with self._key_lock(key):
+                    value = self.loader(key)
+                    with self._lock:
+                        self._entries[key] = (value, time.monotonic())
+            except Exception as e:
+                logger.error(f"Error refreshing cached news for {key}: {str(e)}")
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+        
+        threading.Thread(target=refresh, name=f'refresh-{key}', daemon=True).start()
+
+class RegionStream:
+    """
+    Items of one in-progress streaming load. Every iteration replays the items so
+    far and then follows new ones as they arrive; value is the loaded result once
+    the iteration ends (None when the load failed).
+    """
+    
+    def __init__(self):
+        self.items = []
+        self.value = None
+        self._done = False
+        self._changed = threading.Condition()
+    
+    def append(self, item):
+        with self._changed:
+            self.items.append(item)
+            self._changed.notify_all()
+    
+    def finish(self, value):
+        with self._changed:
+            self.value = value
+            self._done = True
+            self._changed.notify_all()
+    
+    def __iter__(self):
+        position = 0
+        while True:
+            with self._changed:
+                while position == len(self.items) and not self._done:
+                    self._changed.wait()
+                batch = self.items[position:]
+                position = len(self.items)
+                done = self._done
+            
+            yield from batch
+            if done:
+                return
+
+def parse_published_time(value):
+    """Unix time of an ISO 8601 or RFC 822 publication date, or None when it can't be parsed"""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00')).timestamp()
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(value).timestamp()
+    except (TypeError, ValueError):
+        return None
+
+_SEARCH_TOKEN_RE = re.compile(r'\w+\*?')
+
+def _fts_query(text):
+    """
+    Every word of a free-text query as a quoted FTS5 term (all must match), so user
+    input can't be parsed as query syntax; a trailing * keeps prefix matching
+    """
+    terms = []
+    for token in _SEARCH_TOKEN_RE.findall(text):
+        prefix = token.endswith('*')
+        term = f'"{token.rstrip("*")}"'
+        terms.append(term + ' *' if prefix else term)
+    return ' '.join(terms)
+
+class ArticleStore:
+    """
+    SQLite store of analyzed articles, indexed for cheap per-region reads and
+    searchable through an FTS5 index over title, content, entities and source
+    """
+    
+    # bm25 weights for the FTS columns: title, content, entities, source
+    SEARCH_RANK = 'bm25(10.0, 1.0, 5.0, 2.0)'
+    # Matches ranked per query, newest first: bounds the cost of very common terms
+    SEARCH_WINDOW = 2000
+    
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._init_schema()
+    
+    def _connect(self):
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        # A connection must not cross a fork, e.g. the schema setup done in a preloading parent
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
     
-    def _classify_news(self, text, source):
-        """Classify news as real or fake"""
-        confidence = 0.5
-        reasoning = []
+    def _init_schema(self):
+        conn = self._connect()
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS analyzed_articles (
+                    region TEXT NOT NULL,
+                    article_id TEXT NOT NULL,
+                    title TEXT,
+                    content TEXT,
+                    url TEXT,
+                    source TEXT,
+                    category TEXT,
+                    published_at TEXT,
+                    classification TEXT,
+                    confidence REAL,
+                    sentiment TEXT,
+                    sentiment_score REAL,
+                    credibility_score REAL,
+                    entities TEXT,
+                    published_ts REAL,
+                    analysis TEXT NOT NULL,
+                    first_seen_at REAL NOT NULL,
+                    fetched_at REAL NOT NULL,
+                    PRIMARY KEY (region, article_id)
+                )
+            ''')
+            self._add_search_columns(conn)
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_region_fetched
+                ON analyzed_articles (region, fetched_at DESC)
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_region_published
+                ON analyzed_articles (region, published_ts DESC)
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_classification_published
+                ON analyzed_articles (classification, published_ts DESC)
+            ''')
+            conn.execute('''
+                CREATE INDEX IF NOT EXISTS idx_articles_published
+                ON analyzed_articles (published_ts DESC)
+            ''')
+            self._init_search_index(conn)
+            self._init_rollups(conn)
+            self._init_entity_index(conn)
+    
+    @staticmethod
+    def _add_search_columns(conn):
+        """Bring a database created before search existed up to date, filling the new columns"""
+        columns = {row[1] for row in conn.execute('PRAGMA table_info(analyzed_articles)')}
+        if 'entities' not in columns:
+            conn.execute('ALTER TABLE analyzed_articles ADD COLUMN entities TEXT')
+            conn.execute('''
+                UPDATE analyzed_articles SET entities = (
+                    SELECT group_concat(value, ', ') FROM json_each(analysis, '$.entities')
+                )
+            ''')
+        if 'published_ts' not in columns:
+            conn.execute('ALTER TABLE analyzed_articles ADD COLUMN published_ts REAL')
+            conn.execute('UPDATE analyzed_articles SET published_ts = fetched_at')
+    
+    @staticmethod
+    def _init_search_index(conn):
+        """
+        External-content FTS5 table kept in sync by triggers, so the text is stored once.
+        It is keyed by the article rowid: run "INSERT INTO articles_fts(articles_fts)
+        VALUES ('rebuild')" after a VACUUM, which may renumber rowids.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'articles_fts'"
+        ).fetchone()
+        if exists:
+            ArticleStore._create_fts_update_trigger(conn)
+            return
         
-        text_lower = text.lower()
+        conn.execute('''
+            CREATE VIRTUAL TABLE articles_fts USING fts5(
+                title, content, entities, source,
+                content='analyzed_articles', content_rowid='rowid',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON analyzed_articles BEGIN
+                INSERT INTO articles_fts (rowid, title, content, entities, source)
+                VALUES (new.rowid, new.title, new.content, new.entities, new.source);
+            END
+        ''')
+        conn.execute('''
+            CREATE TRIGGER IF NOT EXISTS articles_fts_delete AFTER DELETE ON analyzed_articles BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, content, entities, source)
+                VALUES ('delete', old.rowid, old.title, old.content, old.entities, old.source);
+            END
+        ''')
+        ArticleStore._create_fts_update_trigger(conn)
+        conn.execute(
+            "INSERT INTO articles_fts (articles_fts, rank) VALUES ('rank', ?)", (ArticleStore.SEARCH_RANK,)
+        )
+        # Index whatever the table already holds
+        conn.execute("INSERT INTO articles_fts (articles_fts) VALUES ('rebuild')")
+    
+    @staticmethod
+    def _create_fts_update_trigger(conn):
+        """
+        Reindex a row only when an indexed column actually changed: a refetch that
+        only bumps fetched_at or the analysis leaves the FTS index alone. Databases
+        created with the older unconditional trigger get it replaced.
+        """
+        existing = conn.execute(
+            "SELECT sql FROM sqlite_master WHERE type = 'trigger' AND name = 'articles_fts_update'"
+        ).fetchone()
+        if existing and 'UPDATE OF' in existing[0]:
+            return
         
-        # Check for sensational language
-        sensational_words = ['shocking', 'unbelievable', 'breaking', 'exclusive', 'secret', 'exposed']
-        sensational_count = sum(1 for word in sensational_words if word in text_lower)
+        conn.execute('DROP TRIGGER IF EXISTS articles_fts_update')
+        conn.execute('''
+            CREATE TRIGGER articles_fts_update AFTER UPDATE OF title, content, entities, source ON analyzed_articles
+            WHEN old.title IS NOT new.title OR old.content IS NOT new.content
+                OR old.entities IS NOT new.entities OR old.source IS NOT new.source
+            BEGIN
+                INSERT INTO articles_fts (articles_fts, rowid, title, content, entities, source)
+                VALUES ('delete', old.rowid, old.title, old.content, old.entities, old.source);
+                INSERT INTO articles_fts (rowid, title, content, entities, source)
+                VALUES (new.rowid, new.title, new.content, new.entities, new.source);
+            END
+        ''')
+    
+    @staticmethod
+    def article_id(article):
+        """Stable ID for an article: its URL, or its title and source when it has none"""
+        key = article.get('url') or f"{article.get('title', '')}|{article.get('source', '')}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def _init_rollups(conn):
+        """
+        Per-hour analytics buckets (hour first analyzed x region x category x
+        classification) with running sums for the sentiment and confidence means.
+        Triggers move an article between buckets as it is stored, re-analyzed or deleted.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'analytics_rollup'"
+        ).fetchone()
+        if exists:
+            return
         
-        if sensational_count > 2:
-            confidence -= 0.2
-            reasoning.append("Contains excessive sensational language")
+        conn.execute('''
+            CREATE TABLE analytics_rollup (
+                hour INTEGER NOT NULL,
+                region TEXT NOT NULL,
+                category TEXT NOT NULL,
+                classification TEXT NOT NULL,
+                articles INTEGER NOT NULL,
+                sentiment_sum REAL NOT NULL,
+                confidence_sum REAL NOT NULL,
+                PRIMARY KEY (hour, region, category, classification)
+            ) WITHOUT ROWID
+        ''')
         
-        # Check for proper attribution
-        if any(phrase in text_lower for phrase in ['according to', 'sources say', 'reported by', 'study shows']):
-            confidence += 0.15
-            reasoning.append("Contains proper source attribution")
+        def bucket(row):
+            return (
+                f"CAST({row}.first_seen_at / 3600 AS INTEGER) * 3600, {row}.region, "
+                f"coalesce({row}.category, 'General'), coalesce({row}.classification, 'Unknown')"
+            )
         
-        # Check punctuation
-        exclamation_count = text.count('!')
-        if exclamation_count > 3:
-            confidence -= 0.1
-            reasoning.append("Excessive use of exclamation marks")
+        add = f'''
+            INSERT INTO analytics_rollup VALUES (
+                {bucket('new')}, 1, coalesce(new.sentiment_score, 0), coalesce(new.confidence, 0)
+            )
+            ON CONFLICT (hour, region, category, classification) DO UPDATE SET
+                articles = articles + 1,
+                sentiment_sum = sentiment_sum + excluded.sentiment_sum,
+                confidence_sum = confidence_sum + excluded.confidence_sum;
+        '''
+        remove = f'''
+            UPDATE analytics_rollup SET
+                articles = articles - 1,
+                sentiment_sum = sentiment_sum - coalesce(old.sentiment_score, 0),
+                confidence_sum = confidence_sum - coalesce(old.confidence, 0)
+            WHERE (hour, region, category, classification) = ({bucket('old')});
+        '''
+        conn.execute(f'''
+            CREATE TRIGGER analytics_rollup_insert AFTER INSERT ON analyzed_articles BEGIN
+                {add}
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER analytics_rollup_delete AFTER DELETE ON analyzed_articles BEGIN
+                {remove}
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER analytics_rollup_update
+            AFTER UPDATE OF category, classification, sentiment_score, confidence ON analyzed_articles
+            WHEN old.category IS NOT new.category OR old.classification IS NOT new.classification
+                OR old.sentiment_score IS NOT new.sentiment_score OR old.confidence IS NOT new.confidence
+            BEGIN
+                {remove}
+                {add}
+            END
+        ''')
         
-        # Source credibility impact
-        source_score = self._assess_source_credibility(source)
-        confidence += (source_score - 0.5) * 0.3
+        # Roll up whatever the table already holds
+        conn.execute('''
+            INSERT INTO analytics_rollup
+            SELECT CAST(first_seen_at / 3600 AS INTEGER) * 3600, region,
+                   coalesce(category, 'General'), coalesce(classification, 'Unknown'),
+                   count(*), total(sentiment_score), total(confidence)
+            FROM analyzed_articles
+            GROUP BY 1, 2, 3, 4
+        ''')
+    
+    @staticmethod
+    def _init_entity_index(conn):
+        """
+        Inverted entity index: the articles mentioning each entity, plus hourly
+        article counts per entity for trending. Triggers keep both in step with the
+        entities in each stored analysis.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'entity_postings'"
+        ).fetchone()
+        if exists:
+            return
         
-        if source_score > 0.8:
-            reasoning.append("High credibility source")
-        elif source_score < 0.3:
-            reasoning.append("Low credibility source")
+        conn.execute('''
+            CREATE TABLE entity_postings (
+                entity TEXT NOT NULL,
+                region TEXT NOT NULL,
+                article_id TEXT NOT NULL,
+                first_seen_at REAL NOT NULL,
+                PRIMARY KEY (entity, region, article_id)
+            ) WITHOUT ROWID
+        ''')
+        conn.execute('''
+            CREATE INDEX idx_entity_postings_recent ON entity_postings (entity, first_seen_at DESC)
+        ''')
+        conn.execute('''
+            CREATE TABLE entity_hourly (
+                hour INTEGER NOT NULL,
+                entity TEXT NOT NULL,
+                region TEXT NOT NULL,
+                articles INTEGER NOT NULL,
+                PRIMARY KEY (hour, entity, region)
+            ) WITHOUT ROWID
+        ''')
         
-        # Ensure confidence in valid range
-        confidence = max(0.1, min(0.95, confidence))
+        def entities(row):
+            return f"(SELECT DISTINCT value FROM json_each({row}.analysis, '$.entities') WHERE type = 'text')"
         
-        classification = "Real" if confidence > 0.6 else "Fake"
+        add = f'''
+            INSERT OR IGNORE INTO entity_postings (entity, region, article_id, first_seen_at)
+            SELECT value, new.region, new.article_id, new.first_seen_at FROM {entities('new')};
+            INSERT INTO entity_hourly (hour, entity, region, articles)
+            SELECT CAST(new.first_seen_at / 3600 AS INTEGER) * 3600, value, new.region, 1 FROM {entities('new')} WHERE true
+            ON CONFLICT (hour, entity, region) DO UPDATE SET articles = articles + 1;
+        '''
+        remove = f'''
+            DELETE FROM entity_postings
+            WHERE region = old.region AND article_id = old.article_id AND entity IN {entities('old')};
+            UPDATE entity_hourly SET articles = articles - 1
+            WHERE hour = CAST(old.first_seen_at / 3600 AS INTEGER) * 3600 AND region = old.region
+                AND entity IN {entities('old')};
+        '''
+        conn.execute(f'''
+            CREATE TRIGGER entity_index_insert AFTER INSERT ON analyzed_articles BEGIN
+                {add}
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER entity_index_delete AFTER DELETE ON analyzed_articles BEGIN
+                {remove}
+            END
+        ''')
+        conn.execute(f'''
+            CREATE TRIGGER entity_index_update AFTER UPDATE OF entities ON analyzed_articles
+            WHEN old.entities IS NOT new.entities
+            BEGIN
+                {remove}
+                {add}
+            END
+        ''')
         
-        return {
-            'classification': classification,
-            'confidence': confidence,
-            'reasoning': reasoning
-        }
+        # Index whatever the table already holds
+        conn.execute('''
+            INSERT OR IGNORE INTO entity_postings (entity, region, article_id, first_seen_at)
+            SELECT entity.value, a.region, a.article_id, a.first_seen_at
+            FROM analyzed_articles a, json_each(a.analysis, '$.entities') entity
+            WHERE entity.type = 'text'
+        ''')
+        conn.execute('''
+            INSERT INTO entity_hourly (hour, entity, region, articles)
+            SELECT CAST(first_seen_at / 3600 AS INTEGER) * 3600, entity, region, count(*)
+            FROM entity_postings
+            GROUP BY 1, 2, 3
+        ''')
+    
+    def trending_entities(self, since, region=None, limit=20):
+        """
+        Entities by the number of articles mentioning them since the given time,
+        with the count for the window of the same length before it
+        """
+        start = int(since // 3600) * 3600
+        previous_start = start - (int(time.time() // 3600) * 3600 + 3600 - start)
+        sql = '''
+            SELECT entity,
+                   total(CASE WHEN hour >= ? THEN articles END) AS recent,
+                   total(CASE WHEN hour < ? THEN articles END) AS previous
+            FROM entity_hourly
+            WHERE hour >= ?
+        '''
+        params = [start, start, previous_start]
+        if region is not None:
+            sql += ' AND region = ?'
+            params.append(region)
+        sql += '''
+            GROUP BY entity
+            HAVING recent > 0
+            ORDER BY recent DESC, entity
+            LIMIT ?
+        '''
+        params.append(limit)
+        return [
+            {'entity': entity, 'articles': int(recent), 'previous': int(previous)}
+            for entity, recent, previous in self._connect().execute(sql, params)
+        ]
     
-    def _analyze_sentiment(self, text):
-        """Analyze sentiment using VADER"""
-        scores = self.sentiment_analyzer.polarity_scores(text)
-        compound = scores['compound']
+    def articles_for_entity(self, entity, region=None, limit=20, offset=0):
+        """(number of articles mentioning the entity, the newest of them)"""
+        region_filter = ' AND p.region = ?' if region is not None else ''
+        params = [entity] + ([region] if region is not None else [])
         
-        if compound >= 0.05:
-            label = 'Positive'
-        elif compound <= -0.05:
-            label = 'Negative'
-        else:
-            label = 'Neutral'
+        conn = self._connect()
+        total = conn.execute(
+            f'SELECT count(*) FROM entity_postings p WHERE p.entity = ?{region_filter}', params
+        ).fetchone()[0]
+        rows = conn.execute(f'''
+            SELECT a.region, a.analysis, a.published_ts
+            FROM entity_postings p
+            JOIN analyzed_articles a ON a.region = p.region AND a.article_id = p.article_id
+            WHERE p.entity = ?{region_filter}
+            ORDER BY p.first_seen_at DESC
+            LIMIT ? OFFSET ?
+        ''', params + [limit, offset])
+        return total, [self._search_result(*row) for row in rows]
+    
+    def analytics_rollups(self, since, until=None, region=None):
+        """Rollup buckets with articles first analyzed in [since, until), oldest first"""
+        sql = '''
+            SELECT hour, region, category, classification, articles, sentiment_sum, confidence_sum
+            FROM analytics_rollup
+            WHERE hour >= ? AND hour < ? AND articles > 0
+        '''
+        params = [int(since // 3600) * 3600, until if until is not None else float('inf')]
+        if region is not None:
+            sql += ' AND region = ?'
+            params.append(region)
+        return self._connect().execute(sql + ' ORDER BY hour', params).fetchall()
+    
+    def upsert_many(self, region, analyzed_articles):
+        """Insert or refresh analyzed article records for a region"""
+        now = time.time()
+        rows = [
+            (
+                region,
+                self.article_id(record),
+                record.get('title'),
+                record.get('content'),
+                record.get('url'),
+                record.get('source'),
+                record.get('category'),
+                record.get('publishedAt'),
+                record.get('classification'),
+                record.get('confidence'),
+                record.get('sentiment'),
+                record.get('sentiment_score'),
+                record.get('credibility_score'),
+                ', '.join(record.get('entities') or []),
+                parse_published_time(record.get('publishedAt')) or now,
+                json.dumps(record),
+                now,
+                now
+            )
+            for record in analyzed_articles
+        ]
         
-        return {
-            'label': label,
-            'score': compound,
-            'confidence': abs(compound)
-        }
+        conn = self._connect()
+        with conn:
+            conn.executemany('''
+                INSERT INTO analyzed_articles (
+                    region, article_id, title, content, url, source, category, published_at,
+                    classification, confidence, sentiment, sentiment_score, credibility_score,
+                    entities, published_ts, analysis, first_seen_at, fetched_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (region, article_id) DO UPDATE SET
+                    title = excluded.title,
+                    content = excluded.content,
+                    url = excluded.url,
+                    source = excluded.source,
+                    category = excluded.category,
+                    published_at = excluded.published_at,
+                    classification = excluded.classification,
+                    confidence = excluded.confidence,
+                    sentiment = excluded.sentiment,
+                    sentiment_score = excluded.sentiment_score,
+                    credibility_score = excluded.credibility_score,
+                    entities = excluded.entities,
+                    published_ts = excluded.published_ts,
+                    analysis = excluded.analysis,
+                    fetched_at = excluded.fetched_at
+            ''', rows)
+        
+        return len(rows)
     
-    def _extract_entities(self, text):
-        """Simple entity extraction"""
-        entities = []
-        words = text.split()
+    def search(self, query=None, classification=None, region=None, since=None, until=None, limit=20, offset=0):
+        """
+        Analyzed articles matching a free-text query, best match first, or newest
+        first without a query; filtered by classification, region and publication time.
+        Only the newest SEARCH_WINDOW matches are ranked, so a term found in most
+        articles costs no more than a rare one.
+        """
+        filters = []
+        params = []
+        for column, value in (('classification', classification), ('region', region)):
+            if value is not None:
+                filters.append(f'a.{column} = ?')
+                params.append(value)
+        if since is not None:
+            filters.append('a.published_ts >= ?')
+            params.append(since)
+        if until is not None:
+            filters.append('a.published_ts < ?')
+            params.append(until)
+        
+        conn = self._connect()
+        match = _fts_query(query) if query else ''
+        if not match:
+            rows = conn.execute(f'''
+                SELECT a.region, a.analysis, a.published_ts
+                FROM analyzed_articles a
+                {'WHERE ' + ' AND '.join(filters) if filters else ''}
+                ORDER BY a.published_ts DESC
+                LIMIT ? OFFSET ?
+            ''', params + [limit, offset])
+            return [self._search_result(*row) for row in rows]
+        
+        # Rowids grow as articles are first stored, so the newest matches come first
+        candidates = conn.execute(f'''
+            SELECT articles_fts.rowid, articles_fts.rank
+            FROM articles_fts JOIN analyzed_articles a ON a.rowid = articles_fts.rowid
+            WHERE articles_fts MATCH ? {''.join(' AND ' + clause for clause in filters)}
+            ORDER BY articles_fts.rowid DESC
+            LIMIT ?
+        ''', [match] + params + [self.SEARCH_WINDOW]).fetchall()
         
-        for word in words:
-            if word.istitle() and len(word) > 2:
-                entities.append(word)
+        ranked = sorted(candidates, key=lambda candidate: candidate[1])[offset:offset + limit]
+        if not ranked:
+            return []
+        
+        # Snippets only for the page being returned: the rowid range bounds the FTS5 scan,
+        # and the unary + keeps the planner from probing the index once per listed rowid
+        ids = [rowid for rowid, _ in ranked]
+        placeholders = ', '.join('?' * len(ids))
+        snippets = dict(conn.execute(f'''
+            SELECT rowid, snippet(articles_fts, -1, '[', ']', '…', 16) FROM articles_fts
+            WHERE articles_fts MATCH ? AND rowid BETWEEN ? AND ? AND +rowid IN ({placeholders})
+        ''', [match, min(ids), max(ids)] + ids))
+        details = {
+            row[0]: row[1:] for row in conn.execute(f'''
+                SELECT rowid, region, analysis, published_ts FROM analyzed_articles
+                WHERE rowid IN ({placeholders})
+            ''', ids)
+        }
+        
+        results = []
+        for rowid, rank in ranked:
+            result = self._search_result(*details[rowid])
+            result['score'] = round(-rank, 4)  # bm25 ranks better matches lower
+            result['snippet'] = snippets.get(rowid)
+            results.append(result)
+        return results
+    
+    @staticmethod
+    def _search_result(region, analysis, published_ts):
+        result = json.loads(analysis)
+        result['region'] = region
+        result['published_ts'] = published_ts
+        return result
+    
+    def region_version(self, region, limit=15):
+        """
+        Fingerprint of what latest_for_region would return, read from the index
+        without decoding any analysis; None when the region has no articles yet
+        """
+        rows = self._connect().execute('''
+            SELECT article_id, fetched_at FROM analyzed_articles
+            WHERE region = ?
+            ORDER BY fetched_at DESC
+            LIMIT ?
+        ''', (region, limit)).fetchall()
         
-        return list(set(entities))[:10]
+        return self._version(region, rows) if rows else None
     
-    def _assess_source_credibility(self, source):
-        """Assess source credibility"""
-        if not source:
-            return 0.5
+    @staticmethod
+    def _version(region, rows):
+        digest = hashlib.sha1(region.encode('utf-8'))
+        for row in rows:
+            digest.update(f"{row[0]}:{row[1]!r};".encode('utf-8'))
+        return digest.hexdigest()[:20]
+    
+    def latest_for_region(self, region, limit=15):
+        """Return the most recently fetched analyzed articles for a region, newest first"""
+        return self.latest_with_version(region, limit)[0]
+    
+    def latest_with_version(self, region, limit=15):
+        """latest_for_region plus the region_version of exactly the rows it was built from"""
+        rows = self._connect().execute('''
+            SELECT article_id, fetched_at, analysis FROM analyzed_articles
+            WHERE region = ?
+            ORDER BY fetched_at DESC
+            LIMIT ?
+        ''', (region, limit)).fetchall()
         
-        source_lower = source.lower()
+        if not rows:
+            return None, None
         
-        # High credibility sources
-        credible_sources = {
-            'bbc': 0.95, 'reuters': 0.98, 'cnn': 0.90, 'times of india': 0.85,
-            'the hindu': 0.90, 'indian express': 0.85, 'deccan herald': 0.80,
-            'press information bureau': 0.95, 'pib': 0.95
+        payload = {
+            'articles': [json.loads(analysis) for _, _, analysis in rows],
+            'source': region,
+            'total_analyzed': len(rows),
+            'timestamp': datetime.fromtimestamp(rows[0][1]).isoformat(),
+            'data_source': 'live'  # sample fallbacks are never stored
         }
+        return payload, self._version(region, rows)
+
+class FeedWatermarks:
+    """
+    Per-feed high-water marks kept in SQLite: the GUIDs of entries already
+    ingested plus the newest published time seen, so a refresh only processes
+    entries that are actually new, across restarts too.
+    """
+    
+    MAX_SEEN_PER_FEED = 500
+    # Unseen entries older than this before the newest one are treated as already handled
+    PUBLISHED_GRACE = 24 * 3600  # seconds
+    
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._marks = {}  # feed URL -> {'last_published', 'seen'} loaded on first use
+        self._init_schema()
+    
+    def _connect(self):
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        # A connection must not cross a fork, e.g. the schema setup done in a preloading parent
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+    
+    def _init_schema(self):
+        conn = self._connect()
+        with conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS feed_watermarks (
+                    feed_url TEXT PRIMARY KEY,
+                    last_published REAL,
+                    seen_ids TEXT NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            ''')
+    
+    def _mark_for(self, feed_url):
+        """Return the in-memory mark for a feed, loading it from SQLite on first use"""
+        mark = self._marks.get(feed_url)
+        if mark is None:
+            row = self._connect().execute(
+                'SELECT last_published, seen_ids FROM feed_watermarks WHERE feed_url = ?',
+                (feed_url,)
+            ).fetchone()
+            # Insertion-ordered dict doubles as a set that forgets its oldest GUIDs first
+            seen = dict.fromkeys(json.loads(row[1])) if row else {}
+            mark = {'last_published': row[0] if row else None, 'seen': seen}
+            self._marks[feed_url] = mark
+        return mark
+    
+    def is_new(self, feed_url, guid, published=None):
+        """Whether an entry has not been ingested from this feed yet"""
+        with self._lock:
+            mark = self._mark_for(feed_url)
+            if guid in mark['seen']:
+                return False
+            last_published = mark['last_published']
+            if published is not None and last_published is not None:
+                return published >= last_published - self.PUBLISHED_GRACE
+            return True
+    
+    def mark_seen(self, feed_url, entries):
+        """Record (guid, published) entries as ingested and persist the feed's mark"""
+        with self._lock:
+            mark = self._mark_for(feed_url)
+            seen = mark['seen']
+            for guid, published in entries:
+                seen.pop(guid, None)
+                seen[guid] = None
+                if published is not None and (mark['last_published'] is None or published > mark['last_published']):
+                    mark['last_published'] = published
+            
+            while len(seen) > self.MAX_SEEN_PER_FEED:
+                del seen[next(iter(seen))]
+            
+            conn = self._connect()
+            with conn:
+                conn.execute('''
+                    INSERT INTO feed_watermarks (feed_url, last_published, seen_ids, updated_at)
+                    VALUES (?, ?, ?, ?)
+                    ON CONFLICT (feed_url) DO UPDATE SET
+                        last_published = excluded.last_published,
+                        seen_ids = excluded.seen_ids,
+                        updated_at = excluded.updated_at
+                ''', (feed_url, mark['last_published'], json.dumps(list(seen)), time.time()))
+
+class IngestionScheduler:
+    """
+    Background thread that periodically fetches, analyzes and stores every region.
+    Every serving process calls start(), but only the one holding the lock file runs
+    the thread; the others retry once per interval in case the leader exits.
+    """
+    
+    def __init__(self, store, regions, interval=300, lock_path=None):
+        self.store = store
+        self.regions = regions
+        self.interval = interval
+        self.lock_path = lock_path
+        self._stop = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._lock_file = None
+        self._lock_pid = None
+        self._next_attempt = 0
+    
+    def _acquire_leadership(self):
+        """Take the ingestion lock without blocking; it is released when the process exits"""
+        if self.lock_path is None or fcntl is None:
+            return True  # no lock file, or no flock (Windows): a single-process setup
+        if self._lock_file is not None and self._lock_pid == os.getpid():
+            return True
         
-        # Low credibility indicators
-        suspicious_indicators = ['fake', 'conspiracy', 'hoax', 'clickbait']
+        lock_file = open(self.lock_path, 'a')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return False
+        self._lock_file = lock_file
+        self._lock_pid = os.getpid()
+        return True
+    
+    def start(self):
+        """Start the ingestion thread if this process is, or can become, the ingestion leader"""
+        with self._start_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            now = time.monotonic()
+            if now < self._next_attempt:
+                return
+            if not self._acquire_leadership():
+                self._next_attempt = now + self.interval
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='news-ingestion', daemon=True)
+            self._thread.start()
+            logger.info(f"Started news ingestion every {self.interval}s")
+    
+    def stop(self):
+        self._stop.set()
+    
+    def _run(self):
+        while not self._stop.is_set():
+            for region in self.regions:
+                try:
+                    self.ingest_region(region)
+                except Exception as e:
+                    logger.error(f"Error ingesting {region} news: {str(e)}")
+            self._stop.wait(self.interval)
+    
+    def ingest_region(self, region):
+        """Fetch, analyze and upsert one region's new articles"""
+        fetched = []
+        articles = _fetch_region_articles(region, only_new=True, fetched=fetched)
+        if _data_source(articles) == 'sample':
+            # Upstream failed and the client fell back to demo articles: store nothing, retry next round
+            logger.warning(f"Skipped ingesting {region} news: upstream fetch fell back to sample articles")
+            return 0
         
-        for credible, score in credible_sources.items():
-            if credible in source_lower:
-                return score
+        analyzed_articles = _analyze_articles(articles)
+        stored = self.store.upsert_many(region, analyzed_articles)
         
-        if any(indicator in source_lower for indicator in suspicious_indicators):
-            return 0.2
+        # Only now are the RSS entries done; a failed round retries them next time.
+        # Copies and entries cut by the limits are marked too, or they'd stay new and
+        # take the feed's first slots every round
+        news_client.mark_ingested(fetched)
         
-        return 0.6  # Default for unknown sources
+        logger.info(f"Ingested {stored} {region} articles")
+        return stored
+
+_POOL_START_METHOD = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+
+class AnalysisExecutor:
+    """
+    Spreads detector work over a process pool for large article sets.
+    Batches below the threshold run in-process so small requests skip the IPC cost.
+    """
+    
+    def __init__(self, detector, workers=1, parallel_threshold=200, chunk_size=50):
+        self.detector = detector
+        self.workers = workers
+        self.parallel_threshold = parallel_threshold
+        self.chunk_size = chunk_size
+        self._pool = None
+        self._pool_lock = threading.Lock()
     
-    def _detect_suspicious_patterns(self, text):
-        """Detect suspicious patterns in text"""
-        patterns = []
+    def _get_pool(self):
+        """Start the pool on first use, so nothing is forked before the server forks its workers"""
+        with self._pool_lock:
+            if self._pool is None:
+                # forkserver/spawn children don't inherit the serving process's threads and locks
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context(_POOL_START_METHOD),
+                    initializer=analysis_worker.init_worker,
+                    initargs=(
+                        self.detector.sentiment_backend,
+                        self.detector.credibility_file,
+                        self.detector.gazetteer_file
+                    )
+                )
+            return self._pool
+    
+    def analyze_batch(self, items):
+        """Same contract as EnhancedFakeNewsDetector.analyze_batch"""
+        if self.workers <= 1 or len(items) < self.parallel_threshold:
+            return self.detector.analyze_batch(items)
         
-        # Excessive capitalization
-        if sum(1 for c in text if c.isupper()) / len(text) > 0.3:
-            patterns.append("Excessive capitalization")
+        # Answer invalid items and memo hits here; only the misses cross the process boundary
+        results = [None] * len(items)
+        misses = []  # (index, memo key, (title, content, source))
+        for index, item in enumerate(items):
+            try:
+                title, content, source = self.detector._normalize_batch_item(item)
+            except ValueError as e:
+                results[index] = {'index': index, 'error': str(e)}
+                continue
+            
+            key = AnalysisMemo.make_key(title, content, source, self.detector.RULESET_VERSION)
+            cached = self.detector.memo.get(key)
+            if cached is not None:
+                results[index] = self.detector._copy_result(cached)
+                ANALYZED_MEMO.inc()
+            else:
+                misses.append((index, key, (title, content, source)))
         
-        # Too many exclamation marks
-        if text.count('!') > 5:
-            patterns.append("Excessive exclamation marks")
+        if len(misses) < self.parallel_threshold:
+            chunk_results = [self.detector._compute_batch([item for _, _, item in misses])]
+        else:
+            chunks = [
+                [item for _, _, item in misses[start:start + self.chunk_size]]
+                for start in range(0, len(misses), self.chunk_size)
+            ]
+            chunk_results = self._get_pool().map(analysis_worker.analyze_chunk, chunks)
+            # Workers' own metrics stay in their processes, so count their output here
+            ANALYZED_COMPUTED.inc(len(misses))
         
-        # Clickbait phrases
-        clickbait_phrases = ['you won\'t believe', 'doctors hate', 'one weird trick', 'this will shock you']
-        if any(phrase in text.lower() for phrase in clickbait_phrases):
-            patterns.append("Contains clickbait language")
+        analyzed = (result for chunk in chunk_results for result in chunk)
+        for (index, key, _), result in zip(misses, analyzed):
+            if result is None:
+                result = {'index': index, 'error': 'Analysis failed'}
+            else:
+                self.detector.memo.put(key, result)
+                result = self.detector._copy_result(result)
+            results[index] = result
         
-        return patterns
+        return results
+    
+    def shutdown(self):
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
 
 # Initialize components
-news_client = NewsAPIClient()
-detector = EnhancedFakeNewsDetector()
+news_client = NewsAPIClient(
+    dedup_similarity=app.config['DEDUP_MIN_SIMILARITY'],
+    watermarks=FeedWatermarks(app.config['ARTICLES_DB']),
+    hedge_delay=app.config['UPSTREAM_HEDGE_DELAY'],
+    fetch_budget=app.config['UPSTREAM_FETCH_BUDGET'],
+    breaker_failures=app.config['BREAKER_FAILURE_THRESHOLD'],
+    breaker_reset=app.config['BREAKER_RESET_TIMEOUT'],
+    gnews_base=app.config['GNEWS_API_URL'],
+    rss_feeds=app.config['RSS_FEEDS']
+)
+detector = EnhancedFakeNewsDetector(
+    memo_size=app.config['ANALYSIS_MEMO_SIZE'],
+    memo_ttl=app.config['ANALYSIS_MEMO_TTL'],
+    sentiment_backend=app.config['SENTIMENT_BACKEND'],
+    credibility_file=app.config['SOURCE_CREDIBILITY_FILE'],
+    gazetteer_file=app.config['ENTITY_GAZETTEER_FILE']
+)
+analysis_executor = AnalysisExecutor(
+    detector,
+    workers=app.config['ANALYSIS_WORKERS'],
+    parallel_threshold=app.config['ANALYSIS_PARALLEL_THRESHOLD'],
+    chunk_size=app.config['ANALYSIS_CHUNK_SIZE']
+)
+
+def preload_resources():
+    """
+    Load lexicons, rule tables and parsers up front and freeze the heap, so that
+    gunicorn workers forked from a preloading master share them copy-on-write
+    """
+    steps = (
+        ('sentiment_analyzer', detector._sentiment_analyzer.get),
+        ('credibility_index', detector._credibility_index.get),
+        ('entity_gazetteer', detector._entity_gazetteer.get),
+        ('text_tables', load_tables),
+        ('feedparser', feedparser_module.get),
+    )
+    for name, load in steps:
+        started = time.perf_counter()
+        try:
+            load()
+        except ImportError as e:
+            logger.warning(f"Could not preload {name}: {str(e)}")
+        STARTUP_TIMINGS['preload_ms'][name] = round((time.perf_counter() - started) * 1000, 2)
+    
+    # Collected-and-frozen objects are never touched by the collector again, so it won't dirty shared pages
+    gc.collect()
+    gc.freeze()
 
 @app.route('/')
 def index():
@@ -598,46 +1982,86 @@ def index():
                 });
             });
             
+            let currentStream = null;
+            
             function fetchAndAnalyzeNews(source) {
                 document.getElementById('loading').style.display = 'block';
                 document.getElementById('newsGrid').innerHTML = '';
                 
-                fetch(`/api/fetch-news/${source}`)
-                .then(response => response.json())
-                .then(data => {
-                    document.getElementById('loading').style.display = 'none';
-                    displayNews(data.articles);
+                // Cancel a stream still running for a previously selected region
+                if (currentStream) {
+                    currentStream.abort();
+                }
+                const controller = new AbortController();
+                currentStream = controller;
+                
+                // Render each card as soon as its NDJSON line arrives, asking only for what the card shows
+                fetch(`/api/fetch-news/${source}/stream?fields=${CARD_FIELDS}&content_length=200`, { signal: controller.signal })
+                .then(response => {
+                    const reader = response.body.getReader();
+                    const decoder = new TextDecoder();
+                    let buffer = '';
+                    
+                    function handleLine(line) {
+                        if (!line.trim()) return;
+                        const message = JSON.parse(line);
+                        if (message.type === 'article') {
+                            document.getElementById('loading').style.display = 'none';
+                            displayArticle(message.article);
+                        } else if (message.type === 'done') {
+                            document.getElementById('loading').style.display = 'none';
+                            if (message.done.total_analyzed === 0) {
+                                document.getElementById('newsGrid').innerHTML = '<p>No articles found. Please try again.</p>';
+                            }
+                        }
+                    }
+                    
+                    function read() {
+                        return reader.read().then(({ done, value }) => {
+                            if (done) {
+                                handleLine(buffer);
+                                return;
+                            }
+                            buffer += decoder.decode(value, { stream: true });
+                            const lines = buffer.split('\\n');
+                            buffer = lines.pop();
+                            lines.forEach(handleLine);
+                            return read();
+                        });
+                    }
+                    
+                    return read();
                 })
                 .catch(error => {
+                    if (error.name === 'AbortError') return;
                     console.error('Error:', error);
                     document.getElementById('loading').style.display = 'none';
                     document.getElementById('newsGrid').innerHTML = '<p>Error fetching news. Please try again.</p>';
                 });
             }
             
-            function displayNews(articles) {
+            const CARD_FIELDS = 'title,content,source,classification,confidence,sentiment,credibility_score,reasoning,suspicious_patterns';
+            
+            function displayArticle(article) {
                 const grid = document.getElementById('newsGrid');
+                const isReal = article.classification === 'Real';
+                const confidencePercent = (article.confidence * 100).toFixed(1);
                 
-                articles.forEach(article => {
-                    const isReal = article.classification === 'Real';
-                    const confidencePercent = (article.confidence * 100).toFixed(1);
-                    
-                    const card = document.createElement('div');
-                    card.className = 'news-card';
-                    card.innerHTML = `
-                        <div class="news-title">${article.title}</div>
-                        <div class="news-content">${article.content.substring(0, 200)}...</div>
-                        <div><strong>Source:</strong> ${article.source}</div>
-                        <div class="analysis-result ${isReal ? 'real-news' : 'fake-news'}">
-                            <strong>${article.classification}</strong> (${confidencePercent}% confidence)<br>
-                            <strong>Sentiment:</strong> ${article.sentiment}<br>
-                            <strong>Credibility:</strong> ${(article.credibility_score * 100).toFixed(1)}%<br>
-                            ${article.reasoning.length > 0 ? `<em>${article.reasoning.join(', ')}</em><br>` : ''}
-                            ${article.suspicious_patterns.length > 0 ? `<strong>⚠️ Issues:</strong> ${article.suspicious_patterns.join(', ')}` : ''}
-                        </div>
-                    `;
-                    grid.appendChild(card);
-                });
+                const card = document.createElement('div');
+                card.className = 'news-card';
+                card.innerHTML = `
+                    <div class="news-title">${article.title}</div>
+                    <div class="news-content">${article.content.substring(0, 200)}...</div>
+                    <div><strong>Source:</strong> ${article.source}</div>
+                    <div class="analysis-result ${isReal ? 'real-news' : 'fake-news'}">
+                        <strong>${article.classification}</strong> (${confidencePercent}% confidence)<br>
+                        <strong>Sentiment:</strong> ${article.sentiment}<br>
+                        <strong>Credibility:</strong> ${(article.credibility_score * 100).toFixed(1)}%<br>
+                        ${article.reasoning.length > 0 ? `<em>${article.reasoning.join(', ')}</em><br>` : ''}
+                        ${article.suspicious_patterns.length > 0 ? `<strong>⚠️ Issues:</strong> ${article.suspicious_patterns.join(', ')}` : ''}
+                    </div>
+                `;
+                grid.appendChild(card);
             }
             
             // Load Karnataka news by default
@@ -647,47 +2071,536 @@ def index():
     </html>
     '''
 
+def _fetch_region_articles(source, only_new=False, fetched=None):
+    """Fetch raw news articles for a region"""
+    if source == 'karnataka':
+        return news_client.fetch_karnataka_news(max_articles=12, only_new=only_new, fetched=fetched)
+    elif source == 'india':
+        return news_client.fetch_indian_news(max_articles=15, only_new=only_new, fetched=fetched)
+    else:
+        return news_client.fetch_international_news(max_articles=15, only_new=only_new, fetched=fetched)
+
+def _analyze_articles(articles):
+    """Analyze each article for fake news, keeping the fields the dashboard displays"""
+    results = analysis_executor.analyze_batch([
+        {'title': article.title, 'content': article.content, 'source': article.source}
+        for article in articles
+    ])
+    
+    analyzed_articles = []
+    
+    for article, analysis in zip(articles, results):
+        if 'error' in analysis:
+            logger.error(f"Error analyzing article: {analysis['error']}")
+            continue
+        
+        analyzed_articles.append(_with_article_fields(analysis, article))
+    
+    return analyzed_articles
+
+def _with_article_fields(analysis, article):
+    """Add the article fields the dashboard displays to its analysis"""
+    analysis['content'] = article.content
+    analysis['url'] = article.url
+    analysis['category'] = article.category
+    analysis['publishedAt'] = article.published_at
+    return analysis
+
+def _data_source(articles):
+    """'sample' when the fetch fell back to the demo articles, else 'live'"""
+    return 'sample' if any(article.data_source == 'sample' for article in articles) else 'live'
+
+def _build_region_payload(source):
+    """Fetch and analyze news for a region"""
+    articles = _fetch_region_articles(source)
+    data_source = _data_source(articles)
+    analyzed_articles = _analyze_articles(articles)
+    _remember_articles(source, analyzed_articles, data_source)
+    
+    return {
+        'articles': analyzed_articles,
+        'source': source,
+        'total_analyzed': len(analyzed_articles),
+        'timestamp': datetime.now().isoformat(),
+        'data_source': data_source
+    }
+
+def _stream_region_payload(source):
+    """Analyze a region's articles as upstream calls return, yielding each; returns the region payload"""
+    analyzed_articles = []
+    data_source = 'live'
+    for article in news_client.iter_region_news(source, max_articles=REGION_ARTICLE_LIMITS[source]):
+        if article.data_source == 'sample':
+            data_source = 'sample'
+        try:
+            analysis = detector.analyze_article(article.title, article.content, article.source)
+        except Exception as e:
+            logger.error(f"Error analyzing article: {str(e)}")
+            continue
+        
+        analysis = _with_article_fields(analysis, article)
+        analyzed_articles.append(analysis)
+        yield analysis
+    
+    _remember_articles(source, analyzed_articles, data_source)
+    return {
+        'articles': analyzed_articles,
+        'source': source,
+        'total_analyzed': len(analyzed_articles),
+        'timestamp': datetime.now().isoformat(),
+        'data_source': data_source
+    }
+
+def _remember_articles(source, analyzed_articles, data_source='live'):
+    """
+    Keep analyzed articles in the store so they stay searchable after the response.
+    Demo articles served because every upstream failed are not news and are never stored.
+    """
+    if data_source == 'sample':
+        return
+    try:
+        article_store.upsert_many(source, analyzed_articles)
+    except Exception as e:
+        logger.error(f"Error storing analyzed articles for {source}: {str(e)}")
+
+NEWS_REGIONS = ('karnataka', 'india', 'international')
+REGION_ARTICLE_LIMITS = {'karnataka': 12, 'india': 15, 'international': 15}
+
+region_cache = RegionCache(
+    _build_region_payload,
+    ttl=app.config['NEWS_CACHE_TTL'],
+    max_stale=app.config['NEWS_CACHE_MAX_STALE']
+)
+
+article_store = ArticleStore(app.config['ARTICLES_DB'])
+ingestion_scheduler = IngestionScheduler(
+    article_store,
+    NEWS_REGIONS,
+    interval=app.config['INGESTION_INTERVAL'],
+    lock_path=app.config['INGESTION_LOCK']
+)
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+
+@app.before_request
+def start_metrics_publisher():
+    """Publish this worker's metrics for /metrics in any worker to sum (after any fork)"""
+    metrics.start_publishing()
+
+@app.after_request
+def record_request_metrics(response):
+    """Observe request latency per route pattern (not per URL, so label values stay bounded)"""
+    started = g.get('request_started')
+    if started is not None:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        histogram = REQUEST_SECONDS.labels(method=request.method, route=route, status=response.status_code)
+        if response.is_streamed:
+            # The body is produced after this hook returns; time it until the stream is closed
+            response.call_on_close(lambda: histogram.observe(time.perf_counter() - started))
+        else:
+            histogram.observe(time.perf_counter() - started)
+    return response
+
+profile_store = ProfileStore(app.config['ARTICLES_DB'], max_entries=app.config['PROFILE_STORE_SIZE'])
+
+# Their body runs after the profile would be finished, so a profile of them would be empty
+UNPROFILED_ENDPOINTS = {'fetch_news_stream'}
+
+def _profile_token_valid():
+    # Header only: a query-string token would end up in access logs and browser history
+    token = request.headers.get('X-Profile-Token', '')
+    expected = app.config['PROFILE_TOKEN']
+    return bool(expected) and hmac.compare_digest(token.encode('utf-8'), expected.encode('utf-8'))
+
+@app.before_request
+def start_request_profile():
+    """
+    Profile this request when asked with X-Profile (or ?profile=) set to 'stages' or
+    'cprofile' plus the operator token in X-Profile-Token; other requests only pay
+    for the header lookup
+    """
+    mode = request.headers.get('X-Profile') or request.args.get('profile')
+    if not mode:
+        return None
+    
+    if mode not in ('stages', 'cprofile'):
+        return jsonify({'error': "Profile mode must be 'stages' or 'cprofile'"}), 400
+    if request.endpoint in UNPROFILED_ENDPOINTS:
+        return jsonify({'error': 'Streamed responses cannot be profiled'}), 400
+    if not _profile_token_valid():
+        return jsonify({'error': 'Invalid profiling token'}), 403
+    
+    g.profile_mode = mode
+    g.profile_trace, g.profile_trace_token = profiling.start_trace()
+    if mode == 'cprofile':
+        g.profiler = profiling.start_cprofile()
+    return None
+
+@app.after_request
+def finish_request_profile(response):
+    """Store the request's profile and point to it from the response headers"""
+    mode = g.get('profile_mode')
+    if mode is None:
+        return response
+    
+    profiling.end_trace(g.profile_trace_token)
+    profile = {
+        'mode': mode,
+        'method': request.method,
+        'path': request.full_path,
+        'status': response.status_code,
+        'created': datetime.now().isoformat(),
+        'trace': g.profile_trace.to_dict()
+    }
+    if mode == 'cprofile':
+        profile['report'], profile['pstats'] = profiling.cprofile_report(g.profiler)
+    
+    profile_id = profile_store.put(profile)
+    response.headers['X-Profile-Id'] = profile_id
+    response.headers['X-Profile-Url'] = f"/api/profiles/{profile_id}"
+    # Stage totals also show up in the browser's network panel
+    response.headers['Server-Timing'] = ', '.join(
+        f"{name};dur={entry['total_ms']}" for name, entry in profile['trace']['summary'].items()
+    )
+    return response
+
+def _accepts_gzip():
+    return request.accept_encodings['gzip'] > 0
+
+@app.after_request
+def compress_json_response(response):
+    """Gzip JSON responses large enough to be worth it, when the client accepts gzip"""
+    if (
+        response.mimetype != 'application/json'
+        or response.direct_passthrough
+        or response.status_code < 200 or response.status_code >= 300
+        or 'Content-Encoding' in response.headers
+    ):
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    if not _accepts_gzip():
+        return response
+    
+    body = response.get_data()
+    if len(body) < app.config['GZIP_MIN_SIZE']:
+        return response
+    
+    response.set_data(gzip.compress(body, compresslevel=app.config['GZIP_LEVEL']))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
+
+@app.before_request
+def start_ingestion():
+    """Start background ingestion in the serving process (after any fork) that wins the ingestion lock"""
+    if app.config['INGESTION_ENABLED']:
+        ingestion_scheduler.start()
+
+response_cache = RepresentationCache(max_entries=app.config['RESPONSE_CACHE_SIZE'])
+
+def _projection_args():
+    """(fields, content_length) from ?fields=a,b and ?content_length=N; raises ValueError when invalid"""
+    content_length = request.args.get('content_length')
+    if content_length is not None:
+        content_length = int(content_length)
+        if content_length < 0:
+            raise ValueError('content_length must not be negative')
+    return parse_fields(request.args.get('fields')), content_length
+
+def _payload_version(payload):
+    """Fingerprint of a region cache payload: every rebuild gets a new timestamp"""
+    key = f"{payload['source']}|{payload['timestamp']}|{payload['total_analyzed']}"
+    return hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
+
 @app.route('/api/fetch-news/<source>')
 def fetch_news(source):
-    """Fetch and analyze news from specified source"""
+    """
+    Fetch and analyze news from specified source. Supports ?fields= projection,
+    ?content_length= truncation, gzip and If-None-Match revalidation.
+    """
     try:
-        # Fetch news articles
-        if source == 'karnataka':
-            articles = news_client.fetch_karnataka_news(max_articles=12)
-        elif source == 'india':
-            articles = news_client.fetch_indian_news(max_articles=15)
-        elif source == 'international':
-            articles = news_client.fetch_international_news(max_articles=15)
-        else:
+        if source not in NEWS_REGIONS:
             return jsonify({'error': 'Invalid source'}), 400
         
-        # Analyze each article for fake news
-        analyzed_articles = []
+        try:
+            fields, content_length = _projection_args()
+        except ValueError:
+            return jsonify({'error': 'content_length must be a non-negative integer'}), 400
         
-        for article in articles:
-            try:
-                analysis = detector.analyze_article(
-                    article['title'],
-                    article.get('content', article.get('description', '')),
-                    article['source']
+        # With ingestion running the route is an indexed read of the article store
+        payload = version = None
+        if app.config['INGESTION_ENABLED']:
+            version = article_store.region_version(source, limit=REGION_ARTICLE_LIMITS[source])
+            cache_status = 'store'
+        
+        if version is None:
+            payload, cache_status = region_cache.get(source)
+            version = _payload_version(payload)
+        
+        encoding = 'gzip' if _accepts_gzip() else None
+        etag = representation_etag(version, fields, content_length, encoding)
+        
+        # Unchanged since the client's copy: answer before loading or serializing anything
+        if request.if_none_match.contains_weak(etag):
+            response = Response(status=304)
+        else:
+            body = response_cache.get(etag)
+            if body is None:
+                if payload is None:
+                    # Ingestion may have stored new articles since the version was read
+                    payload, version = article_store.latest_with_version(source, limit=REGION_ARTICLE_LIMITS[source])
+                    etag = representation_etag(version, fields, content_length, encoding)
+                body = encode_json(
+                    project_payload(payload, fields, content_length),
+                    gzip_level=app.config['GZIP_LEVEL'] if encoding else None
                 )
-                analyzed_articles.append(analysis)
-                
-            except Exception as e:
-                logger.error(f"Error analyzing article: {str(e)}")
-                continue
+                response_cache.put(etag, body)
+            
+            response = Response(body, mimetype='application/json')
+            if encoding:
+                response.headers['Content-Encoding'] = encoding
         
-        return jsonify({
-            'articles': analyzed_articles,
-            'source': source,
-            'total_analyzed': len(analyzed_articles),
-            'timestamp': datetime.now().isoformat()
-        })
+        response.set_etag(etag)
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.headers['Cache-Control'] = 'no-cache'  # always revalidate, usually for a 304
+        response.headers['X-Cache'] = cache_status
+        return response
         
     except Exception as e:
         logger.error(f"Error fetching news: {str(e)}")
         return jsonify({'error': 'Failed to fetch news'}), 500
 
+@app.route('/api/fetch-news/<source>/stream')
+def fetch_news_stream(source):
+    """
+    Stream analyzed articles as each one is ready, as NDJSON (default) or
+    Server-Sent Events (?format=sse)
+    """
+    if source not in NEWS_REGIONS:
+        return jsonify({'error': 'Invalid source'}), 400
+    
+    stream_format = request.args.get('format', 'ndjson')
+    if stream_format not in ('ndjson', 'sse'):
+        return jsonify({'error': 'Invalid format'}), 400
+    
+    try:
+        fields, content_length = _projection_args()
+    except ValueError:
+        return jsonify({'error': 'content_length must be a non-negative integer'}), 400
+    
+    # Already analyzed results are replayed; otherwise analyze as upstream calls return
+    payload = None
+    if app.config['INGESTION_ENABLED']:
+        payload = article_store.latest_for_region(source, limit=REGION_ARTICLE_LIMITS[source])
+    if payload is None:
+        cached = region_cache.peek(source)
+        payload = cached[0] if cached else None
+    
+    def encode(event, data):
+        if event == 'article':
+            data = project_article(data, fields, content_length)
+        body = json.dumps(data)
+        if stream_format == 'sse':
+            return f"event: {event}\ndata: {body}\n\n"
+        return json.dumps({'type': event, event: data}) + '\n'
+    
+    def generate():
+        if payload is not None:
+            for analysis in payload['articles']:
+                yield encode('article', analysis)
+            yield encode('done', {
+                'source': source,
+                'total_analyzed': payload['total_analyzed'],
+                'timestamp': payload['timestamp']
+            })
+            return
+        
+        # Cold region: follow the one upstream fan-out every concurrent client shares
+        flight = region_cache.stream(source, _stream_region_payload, lambda payload: payload['articles'])
+        for analysis in flight:
+            yield encode('article', analysis)
+        
+        yield encode('done', {
+            'source': source,
+            'total_analyzed': len(flight.items),
+            'timestamp': flight.value['timestamp'] if flight.value else datetime.now().isoformat()
+        })
+    
+    mimetype = 'text/event-stream' if stream_format == 'sse' else 'application/x-ndjson'
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.headers['Cache-Control'] = 'no-cache'
+    response.headers['X-Accel-Buffering'] = 'no'  # Don't let a reverse proxy buffer the stream
+    return response
+
+@app.route('/api/search')
+def search_articles():
+    """
+    Search stored analyzed articles: ?q= free text over title, content, entities
+    and source, filtered by ?classification=, ?region=, ?days= or ?since=/?until=
+    """
+    try:
+        limit = min(int(request.args.get('limit', 20)), 100)
+        offset = int(request.args.get('offset', 0))
+        days = request.args.get('days')
+        since = time.time() - float(days) * 86400 if days else None
+        until = None
+        if request.args.get('since'):
+            since = parse_published_time(request.args['since'])
+        if request.args.get('until'):
+            until = parse_published_time(request.args['until'])
+        fields, content_length = _projection_args()
+    except ValueError:
+        return jsonify({'error': 'Invalid limit, offset, days or content_length'}), 400
+    
+    if limit < 1 or offset < 0:
+        return jsonify({'error': 'Invalid limit, offset, days or content_length'}), 400
+    if (request.args.get('since') and since is None) or (request.args.get('until') and until is None):
+        return jsonify({'error': 'since and until must be ISO 8601 dates'}), 400
+    
+    region = request.args.get('region')
+    if region is not None and region not in NEWS_REGIONS:
+        return jsonify({'error': 'Invalid region'}), 400
+    
+    try:
+        started = time.perf_counter()
+        results = article_store.search(
+            query=request.args.get('q', '').strip() or None,
+            classification=request.args.get('classification'),
+            region=region,
+            since=since,
+            until=until,
+            limit=limit,
+            offset=offset
+        )
+        took_ms = (time.perf_counter() - started) * 1000
+        
+        return jsonify({
+            'results': [project_article(result, fields, content_length) for result in results],
+            'count': len(results),
+            'limit': limit,
+            'offset': offset,
+            'took_ms': round(took_ms, 2)
+        })
+    except Exception as e:
+        logger.error(f"Error searching articles: {str(e)}")
+        return jsonify({'error': 'Search failed'}), 500
+
+@app.route('/api/entities/trending')
+def trending_entities():
+    """Entities mentioned by the most articles in the last ?hours= (default 24)"""
+    try:
+        hours = float(request.args.get('hours', 24))
+        limit = min(int(request.args.get('limit', 20)), 100)
+    except ValueError:
+        return jsonify({'error': 'Invalid hours or limit'}), 400
+    if hours <= 0 or limit < 1:
+        return jsonify({'error': 'Invalid hours or limit'}), 400
+    
+    region = request.args.get('region')
+    if region is not None and region not in NEWS_REGIONS:
+        return jsonify({'error': 'Invalid region'}), 400
+    
+    try:
+        since = time.time() - hours * 3600
+        entities = article_store.trending_entities(since, region=region, limit=limit)
+        types = detector.entity_gazetteer.types
+        for entry in entities:
+            entry['type'] = types.get(entry['entity'], 'other')
+        
+        return jsonify({
+            'entities': entities,
+            'hours': hours,
+            'region': region,
+            'since': datetime.fromtimestamp(since).isoformat()
+        })
+    except Exception as e:
+        logger.error(f"Error finding trending entities: {str(e)}")
+        return jsonify({'error': 'Trending entities failed'}), 500
+
+@app.route('/api/entities/<path:name>')
+def entity_articles(name):
+    """Stored articles mentioning an entity, newest first; aliases resolve to the entity (Bangalore -> Bengaluru)"""
+    try:
+        limit = min(int(request.args.get('limit', 20)), 100)
+        offset = int(request.args.get('offset', 0))
+        fields, content_length = _projection_args()
+    except ValueError:
+        return jsonify({'error': 'Invalid limit, offset or content_length'}), 400
+    if limit < 1 or offset < 0:
+        return jsonify({'error': 'Invalid limit, offset or content_length'}), 400
+    
+    region = request.args.get('region')
+    if region is not None and region not in NEWS_REGIONS:
+        return jsonify({'error': 'Invalid region'}), 400
+    
+    try:
+        gazetteer = detector.entity_gazetteer
+        entity = gazetteer.canonical(name) or name
+        total, articles = article_store.articles_for_entity(entity, region=region, limit=limit, offset=offset)
+        
+        return jsonify({
+            'entity': entity,
+            'type': gazetteer.types.get(entity, 'other'),
+            'total': total,
+            'articles': [project_article(article, fields, content_length) for article in articles],
+            'limit': limit,
+            'offset': offset
+        })
+    except Exception as e:
+        logger.error(f"Error looking up entity {name}: {str(e)}")
+        return jsonify({'error': 'Entity lookup failed'}), 500
+
+@app.route('/api/analytics')
+def analytics_report():
+    """
+    Article counts by classification, region, category and time, with sentiment
+    and confidence means, for the last ?hours= (default one week); ?format=csv
+    exports the underlying hourly buckets
+    """
+    try:
+        hours = float(request.args.get('hours', 168))
+    except ValueError:
+        return jsonify({'error': 'hours must be a number'}), 400
+    if hours <= 0:
+        return jsonify({'error': 'hours must be a number'}), 400
+    
+    granularity = request.args.get('granularity', 'hour')
+    if granularity not in ('hour', 'day'):
+        return jsonify({'error': "granularity must be 'hour' or 'day'"}), 400
+    
+    output_format = request.args.get('format', 'json')
+    if output_format not in ('json', 'csv'):
+        return jsonify({'error': "format must be 'json' or 'csv'"}), 400
+    
+    region = request.args.get('region')
+    if region is not None and region not in NEWS_REGIONS:
+        return jsonify({'error': 'Invalid region'}), 400
+    
+    try:
+        now = time.time()
+        since = now - hours * 3600
+        buckets = article_store.analytics_rollups(since, region=region)
+        
+        if output_format == 'csv':
+            response = Response(analytics.to_csv(buckets), mimetype='text/csv')
+            filename = f"fake-news-analytics-{datetime.now().strftime('%Y-%m-%d')}.csv"
+            response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+            return response
+        
+        return jsonify({
+            **analytics.summarize(buckets, granularity),
+            'since': datetime.fromtimestamp(since).isoformat(),
+            'until': datetime.fromtimestamp(now).isoformat(),
+            'region': region,
+            'granularity': granularity,
+            'buckets': len(buckets)
+        })
+    except Exception as e:
+        logger.error(f"Error building analytics: {str(e)}")
+        return jsonify({'error': 'Analytics failed'}), 500
+
 @app.route('/api/analyze-manual', methods=['POST'])
 def analyze_manual():
     """Analyze manually provided article"""
@@ -708,5 +2621,92 @@ def analyze_manual():
         logger.error(f"Error in manual analysis: {str(e)}")
         return jsonify({'error': 'Analysis failed'}), 500
 
+@app.route('/api/analyze-batch', methods=['POST'])
+def analyze_batch():
+    """Analyze a list of {title, content, source} articles, returning results in the same order"""
+    try:
+        data = request.get_json(silent=True)
+        articles = data.get('articles') if isinstance(data, dict) else data
+        
+        if not isinstance(articles, list):
+            return jsonify({'error': 'Expected a list of articles'}), 400
+        
+        if len(articles) > app.config['MAX_BATCH_SIZE']:
+            return jsonify({'error': f"Batch too large (max {app.config['MAX_BATCH_SIZE']} articles)"}), 413
+        
+        results = analysis_executor.analyze_batch(articles)
+        
+        return jsonify({
+            'results': results,
+            'total': len(results),
+            'failed': sum(1 for result in results if 'error' in result)
+        })
+        
+    except Exception as e:
+        logger.error(f"Error in batch analysis: {str(e)}")
+        return jsonify({'error': 'Analysis failed'}), 500
+
+@app.route('/api/cache-stats')
+def cache_stats():
+    """Hit/miss counters for sizing the analysis memo and sentence cache"""
+    stats = {
+        'analysis_memo': detector.memo.stats()
+    }
+    if isinstance(detector.sentiment_analyzer, FastSentimentAnalyzer):
+        stats['sentiment_sentence_cache'] = detector.sentiment_analyzer.cache_stats()
+    return jsonify(stats)
+
+@app.route('/metrics')
+def metrics_endpoint():
+    """Counters and latency histograms in Prometheus text format, summed over every worker process when PROMETHEUS_MULTIPROC_DIR is set"""
+    return Response(metrics.render(), content_type=METRICS_CONTENT_TYPE)
+
+@app.route('/api/profiles/<profile_id>')
+def get_profile(profile_id):
+    """
+    Download a captured profile: JSON stage trace by default, the cProfile table
+    with ?format=text, or marshalled stats for pstats/snakeviz with ?format=pstats
+    """
+    if not _profile_token_valid():
+        return jsonify({'error': 'Invalid profiling token'}), 403
+    
+    profile = profile_store.get(profile_id)
+    if profile is None:
+        return jsonify({'error': 'Profile not found'}), 404
+    
+    output = request.args.get('format', 'json')
+    if output in ('text', 'pstats') and 'report' not in profile:
+        return jsonify({'error': 'Profile was captured without cProfile'}), 400
+    if output == 'text':
+        return Response(profile['report'], content_type='text/plain; charset=utf-8')
+    if output == 'pstats':
+        response = Response(profile['pstats'], content_type='application/octet-stream')
+        response.headers['Content-Disposition'] = f'attachment; filename="{profile_id}.pstats"'
+        return response
+    
+    return jsonify({key: value for key, value in profile.items() if key != 'pstats'})
+
+@app.route('/api/startup-stats')
+def startup_stats():
+    """Import and preload times of this process, and resources it loaded on demand"""
+    return jsonify({**STARTUP_TIMINGS, 'worker_pid': os.getpid()})
+
+@app.route('/api/upstream-health')
+def upstream_health():
+    """Circuit breaker state for GNews and each RSS feed"""
+    return jsonify(news_client.breaker_stats())
+
+if app.config['PRELOAD_RESOURCES']:
+    STARTUP_TIMINGS['mode'] = 'preload'
+    preload_resources()
+else:
+    STARTUP_TIMINGS['mode'] = 'lazy'
+
+STARTUP_TIMINGS['import_ms'] = round((time.perf_counter() - _import_started) * 1000, 2)
+logger.info(
+    f"App ready in {STARTUP_TIMINGS['import_ms']}ms ({STARTUP_TIMINGS['mode']} resources"
+    f"{', preload ' + str(STARTUP_TIMINGS['preload_ms']) if STARTUP_TIMINGS['preload_ms'] else ''})"
+)
+
 if __name__ == '__main__':
     app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
@@ -0,0 +1,95 @@
+"""
+Gazetteer-Based Entity Extraction
+Known place, person and organisation names (and their aliases) are compiled into
+a token trie and matched in one left-to-right pass, longest name first
+"""
+
+import json
+import re
+
+# Words, keeping letters and digits together; names and text are split the same way,
+# so "U.S." in the gazetteer matches "U.S." in an article
+_TOKEN_RE = re.compile(r'[^\W_]+')
+
+_END = ''  # trie key marking that a name ends at this node
+
+
+class EntityGazetteer:
+    """
+    A trie of gazetteer names over lowercased tokens. extract() returns canonical
+    names in a fixed order: most mentioned first, ties by first mention.
+    """
+
+    def __init__(self, entities):
+        # entities: [{'name', 'type', 'aliases'}], the name is what extraction reports
+        self.types = {}
+        self._root = {}
+        self._canonical = {}  # lowercased name or alias -> canonical name
+
+        for entity in entities:
+            name = entity['name']
+            self.types.setdefault(name, entity.get('type', 'other'))
+            for surface in [name] + entity.get('aliases', []):
+                tokens = [token.lower() for token in _TOKEN_RE.findall(surface)]
+                if not tokens:
+                    continue
+                node = self._root
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                # The first entry listing a surface form owns it; acronyms ("WHO") must match in capitals
+                node.setdefault(_END, (name, surface.isupper()))
+                self._canonical.setdefault(' '.join(tokens), name)
+
+    @classmethod
+    def from_file(cls, path):
+        """Load the gazetteer from a JSON data file"""
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        return cls(data['entities'])
+
+    def canonical(self, name):
+        """The canonical name for a name or alias in any case, or None when it is not in the gazetteer"""
+        return self._canonical.get(' '.join(token.lower() for token in _TOKEN_RE.findall(name or '')))
+
+    def mentions(self, text):
+        """
+        Mention counts per canonical name, in order of first mention. Matches are
+        leftmost-longest and don't overlap, and must start with a capitalized word,
+        so a name that is also an everyday word only counts when written as a name.
+        """
+        tokens = _TOKEN_RE.findall(text)
+        count = len(tokens)
+        root = self._root
+        counts = {}
+
+        position = 0
+        while position < count:
+            token = tokens[position]
+            # Most words can't start a match: skip them without lowercasing
+            node = root.get(token.lower()) if token[0].isupper() else None
+            found = None
+            end = position
+            while node is not None:
+                end += 1
+                if _END in node:
+                    name, acronym = node[_END]
+                    if not acronym or all(word.isupper() for word in tokens[position:end]):
+                        found = (end, name)
+                if end == count:
+                    break
+                node = node.get(tokens[end].lower())
+
+            if found is not None:
+                end, name = found
+                counts[name] = counts.get(name, 0) + 1
+                position = end
+            else:
+                position += 1
+
+        return counts
+
+    def extract(self, text, limit=10):
+        """Canonical names mentioned in the text, most mentioned first"""
+        counts = self.mentions(text)
+        # sorted() is stable, so equal counts keep their first-mention order
+        return sorted(counts, key=lambda name: -counts[name])[:limit]
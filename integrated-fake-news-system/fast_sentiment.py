@@ -0,0 +1,280 @@
+"""
+Fast VADER-Compatible Sentiment Engine
+Scores text with the VADER lexicon and rules, caching work per sentence
+"""
+
+import string
+import threading
+from collections import OrderedDict
+
+from vaderSentiment.vaderSentiment import (
+    BOOSTER_DICT, C_INCR, N_SCALAR, NEGATE, SPECIAL_CASES,
+    SentimentIntensityAnalyzer, allcap_differential
+)
+
+NEGATE_WORDS = frozenset(NEGATE)
+
+# Tokens whose valence can depend on words before or after them in the text.
+# The first HEAD tokens of a sentence look back into the previous sentence
+# (VADER reads up to 3 words back); the last TAIL tokens look ahead (up to 2 words).
+HEAD = 3
+TAIL = 2
+
+
+class FastSentimentAnalyzer:
+    """
+    Drop-in replacement for SentimentIntensityAnalyzer.polarity_scores.
+
+    Uses the same lexicon and rules as vaderSentiment, but:
+    - emoji replacement is skipped outright for text without emoji
+    - every token is lowercased once, instead of once per lexicon word per rule
+    - valences of a sentence's interior tokens are cached by sentence, so
+      boilerplate sentences repeated across wire stories are scored once
+    """
+
+    def __init__(self, analyzer=None, cache_size=50000):
+        self.analyzer = analyzer or SentimentIntensityAnalyzer()
+        self.lexicon = self.analyzer.lexicon
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()  # (sentence tokens, is_cap_diff) -> interior valences
+        self._lock = threading.Lock()
+
+        # VADER only ever replaces single-character emoji
+        self._emojis = {emoji: text for emoji, text in self.analyzer.emojis.items() if len(emoji) == 1}
+        self._emoji_chars = frozenset(self._emojis)
+
+    def polarity_scores(self, text):
+        """Same result as SentimentIntensityAnalyzer.polarity_scores"""
+        text = self._replace_emojis(text).strip()
+
+        raw_tokens = text.split()
+        tokens = [_strip_punc_if_word(token) for token in raw_tokens]
+        lowers = [token.lower() for token in tokens]
+        is_cap_diff = allcap_differential(tokens)
+
+        sentiments = []
+        for start, end in _sentence_spans(raw_tokens):
+            sentiments.extend(self._span_valences(tokens, lowers, start, end, is_cap_diff))
+
+        if 'but' in lowers:
+            sentiments = SentimentIntensityAnalyzer._but_check(tokens, sentiments)
+
+        return self.analyzer.score_valence(sentiments, text)
+
+    def polarity_scores_batch(self, texts):
+        """polarity_scores for many texts, scoring each distinct text once"""
+        scores = {}
+        for text in texts:
+            if text not in scores:
+                scores[text] = self.polarity_scores(text)
+        return [scores[text] for text in texts]
+
+    def cache_stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._cache),
+                'max_entries': self.cache_size,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def _replace_emojis(self, text):
+        """Replace emoji with their descriptions, spaced exactly as VADER does"""
+        if text.isascii() or self._emoji_chars.isdisjoint(text):
+            return text
+
+        parts = []
+        prev_space = True
+        for char in text:
+            description = self._emojis.get(char)
+            if description is not None:
+                if not prev_space:
+                    parts.append(' ')
+                parts.append(description)
+                prev_space = False
+            else:
+                parts.append(char)
+                prev_space = char == ' '
+
+        return ''.join(parts)
+
+    def _span_valences(self, tokens, lowers, start, end, is_cap_diff):
+        """Valences for tokens[start:end], reusing cached interior valences for repeated sentences"""
+        if end - start <= HEAD + TAIL:
+            return self._token_valences(tokens, lowers, start, end, is_cap_diff)
+
+        # Interior tokens only read words inside the sentence, so they can be cached by sentence
+        key = (tuple(tokens[start:end]), is_cap_diff)
+        with self._lock:
+            interior = self._cache.get(key)
+            if interior is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+
+        if interior is None:
+            interior = self._token_valences(tokens, lowers, start + HEAD, end - TAIL, is_cap_diff)
+            with self._lock:
+                self._cache[key] = interior
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return (
+            self._token_valences(tokens, lowers, start, start + HEAD, is_cap_diff)
+            + interior
+            + self._token_valences(tokens, lowers, end - TAIL, end, is_cap_diff)
+        )
+
+    def _token_valences(self, tokens, lowers, start, end, is_cap_diff):
+        """VADER's per-token valence rules for tokens[start:end], reading neighbours across the whole text"""
+        lexicon = self.lexicon
+        count = len(tokens)
+        valences = []
+
+        for i in range(start, end):
+            lower = lowers[i]
+
+            # Modifiers and 'kind of' carry no valence of their own
+            if lower in BOOSTER_DICT or (i < count - 1 and lower == 'kind' and lowers[i + 1] == 'of'):
+                valences.append(0)
+                continue
+
+            valence = 0
+            lexicon_valence = lexicon.get(lower)
+            if lexicon_valence is not None:
+                valence = lexicon_valence
+
+                # 'no' negating the next lexicon word rather than standing alone
+                if lower == 'no' and i != count - 1 and lowers[i + 1] in lexicon:
+                    valence = 0.0
+                if (i > 0 and lowers[i - 1] == 'no') \
+                        or (i > 1 and lowers[i - 2] == 'no') \
+                        or (i > 2 and lowers[i - 3] == 'no' and lowers[i - 1] in ('or', 'nor')):
+                    valence = lexicon_valence * N_SCALAR
+
+                # ALL CAPS emphasis
+                if tokens[i].isupper() and is_cap_diff:
+                    if valence > 0:
+                        valence += C_INCR
+                    else:
+                        valence -= C_INCR
+
+                for start_i in range(0, 3):
+                    j = i - (start_i + 1)
+                    if i > start_i and lowers[j] not in lexicon:
+                        scalar = _scalar_inc_dec(tokens[j], lowers[j], valence, is_cap_diff)
+                        if start_i == 1 and scalar != 0:
+                            scalar = scalar * 0.95
+                        if start_i == 2 and scalar != 0:
+                            scalar = scalar * 0.9
+                        valence = valence + scalar
+                        valence = _negation_check(valence, lowers, start_i, i)
+                        if start_i == 2:
+                            valence = _special_idioms_check(valence, lowers, i)
+
+                valence = self._least_check(valence, lowers, i)
+
+            valences.append(valence)
+
+        return valences
+
+    def _least_check(self, valence, lowers, i):
+        if i > 1 and lowers[i - 1] not in self.lexicon and lowers[i - 1] == 'least':
+            if lowers[i - 2] != 'at' and lowers[i - 2] != 'very':
+                valence = valence * N_SCALAR
+        elif i > 0 and lowers[i - 1] not in self.lexicon and lowers[i - 1] == 'least':
+            valence = valence * N_SCALAR
+        return valence
+
+
+def _strip_punc_if_word(token):
+    stripped = token.strip(string.punctuation)
+    if len(stripped) <= 2:
+        return token
+    return stripped
+
+
+def _sentence_spans(raw_tokens):
+    """(start, end) token ranges of each sentence, split after tokens ending in . ! or ?"""
+    spans = []
+    start = 0
+    for i, token in enumerate(raw_tokens):
+        if token[-1] in '.!?':
+            spans.append((start, i + 1))
+            start = i + 1
+    if start < len(raw_tokens):
+        spans.append((start, len(raw_tokens)))
+    return spans
+
+
+def _negated(word):
+    return word in NEGATE_WORDS or "n't" in word
+
+
+def _scalar_inc_dec(word, word_lower, valence, is_cap_diff):
+    scalar = 0.0
+    if word_lower in BOOSTER_DICT:
+        scalar = BOOSTER_DICT[word_lower]
+        if valence < 0:
+            scalar *= -1
+        if word.isupper() and is_cap_diff:
+            if valence > 0:
+                scalar += C_INCR
+            else:
+                scalar -= C_INCR
+    return scalar
+
+
+def _negation_check(valence, lowers, start_i, i):
+    if start_i == 0:
+        if _negated(lowers[i - 1]):
+            valence = valence * N_SCALAR
+    if start_i == 1:
+        if lowers[i - 2] == 'never' and (lowers[i - 1] == 'so' or lowers[i - 1] == 'this'):
+            valence = valence * 1.25
+        elif lowers[i - 2] == 'without' and lowers[i - 1] == 'doubt':
+            valence = valence
+        elif _negated(lowers[i - 2]):
+            valence = valence * N_SCALAR
+    if start_i == 2:
+        if lowers[i - 3] == 'never' and (lowers[i - 2] == 'so' or lowers[i - 2] == 'this') or \
+                (lowers[i - 1] == 'so' or lowers[i - 1] == 'this'):
+            valence = valence * 1.25
+        elif lowers[i - 3] == 'without' and (lowers[i - 2] == 'doubt' or lowers[i - 1] == 'doubt'):
+            valence = valence
+        elif _negated(lowers[i - 3]):
+            valence = valence * N_SCALAR
+    return valence
+
+
+def _special_idioms_check(valence, lowers, i):
+    onezero = f"{lowers[i - 1]} {lowers[i]}"
+    twoonezero = f"{lowers[i - 2]} {lowers[i - 1]} {lowers[i]}"
+    twoone = f"{lowers[i - 2]} {lowers[i - 1]}"
+    threetwoone = f"{lowers[i - 3]} {lowers[i - 2]} {lowers[i - 1]}"
+    threetwo = f"{lowers[i - 3]} {lowers[i - 2]}"
+
+    for sequence in (onezero, twoonezero, twoone, threetwoone, threetwo):
+        if sequence in SPECIAL_CASES:
+            valence = SPECIAL_CASES[sequence]
+            break
+
+    if len(lowers) - 1 > i:
+        zeroone = f"{lowers[i]} {lowers[i + 1]}"
+        if zeroone in SPECIAL_CASES:
+            valence = SPECIAL_CASES[zeroone]
+    if len(lowers) - 1 > i + 1:
+        zeroonetwo = f"{lowers[i]} {lowers[i + 1]} {lowers[i + 2]}"
+        if zeroonetwo in SPECIAL_CASES:
+            valence = SPECIAL_CASES[zeroonetwo]
+
+    # Booster/dampener bi-grams such as 'sort of' or 'kind of'
+    for n_gram in (threetwoone, threetwo, twoone):
+        if n_gram in BOOSTER_DICT:
+            valence = valence + BOOSTER_DICT[n_gram]
+    return valence
@@ -0,0 +1,48 @@
+"""
+Gunicorn Configuration for the Fake News Detection API
+Usage: gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+import time
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 60))
+
+# Import the app once in the master: lexicons and rule tables are built there and
+# shared copy-on-write by every worker instead of being rebuilt per worker
+preload_app = True
+os.environ.setdefault('PRELOAD_RESOURCES', '1')
+
+# The app splits the CPUs between the workers' analysis pools (ANALYSIS_WORKERS)
+os.environ.setdefault('GUNICORN_WORKERS', str(workers))
+
+# Workers publish their metrics here so /metrics in any worker reports the sum of all of them
+os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), f'news-api-metrics-{os.getpid()}'))
+
+_master_started = time.perf_counter()
+
+
+def on_starting(server):
+    # Start from empty files: counts of a previous run must not be summed in
+    shutil.rmtree(os.environ['PROMETHEUS_MULTIPROC_DIR'], ignore_errors=True)
+    os.makedirs(os.environ['PROMETHEUS_MULTIPROC_DIR'], exist_ok=True)
+
+
+def when_ready(server):
+    server.log.info(f"Master ready in {(time.perf_counter() - _master_started) * 1000:.0f}ms")
+
+
+def post_fork(server, worker):
+    worker.spawn_started = time.perf_counter()
+
+
+def post_worker_init(worker):
+    worker.log.info(
+        f"Worker {worker.pid} ready in {(time.perf_counter() - worker.spawn_started) * 1000:.1f}ms after fork"
+    )
@@ -0,0 +1,87 @@
+"""
+Compact JSON Responses for the Article Endpoints
+Field projection, content truncation, gzip and strong ETags, with encoded bodies
+cached per representation so repeat polls skip serialization entirely
+"""
+
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+# Always kept by a projection: what a client needs to tell the articles apart
+REQUIRED_FIELDS = ('title', 'url')
+
+
+def parse_fields(value):
+    """The article fields asked for in ?fields=a,b,c, or None for every field"""
+    if not value:
+        return None
+    fields = [name.strip() for name in value.split(',') if name.strip()]
+    return tuple(dict.fromkeys(REQUIRED_FIELDS + tuple(fields)))
+
+
+def project_article(article, fields=None, content_length=None):
+    """A copy of one analyzed article with only the requested fields and its content cut short"""
+    if fields is None:
+        projected = dict(article)
+    else:
+        projected = {name: article[name] for name in fields if name in article}
+
+    content = projected.get('content')
+    if content_length is not None and content and len(content) > content_length:
+        projected['content'] = content[:content_length]
+        projected['content_truncated'] = True
+
+    return projected
+
+
+def project_payload(payload, fields=None, content_length=None):
+    """A region payload with every article projected; the payload itself is left untouched"""
+    if fields is None and content_length is None:
+        return payload
+    return {
+        **payload,
+        'articles': [project_article(article, fields, content_length) for article in payload['articles']]
+    }
+
+
+def representation_etag(version, fields, content_length, encoding):
+    """
+    Strong ETag for one representation of a payload version: each projection,
+    truncation and content encoding is a different byte sequence, so each gets its own tag
+    """
+    variant = f"{','.join(fields) if fields else '*'}|{content_length}|{encoding or 'identity'}"
+    return f"{version}-{hashlib.sha1(variant.encode('utf-8')).hexdigest()[:12]}"
+
+
+def encode_json(payload, gzip_level=None):
+    """Serialize compactly, gzipped when a level is given (mtime 0, so the bytes are reproducible)"""
+    body = json.dumps(payload, separators=(',', ':')).encode('utf-8')
+    if gzip_level is not None:
+        body = gzip.compress(body, compresslevel=gzip_level, mtime=0)
+    return body
+
+
+class RepresentationCache:
+    """The most recently sent encoded bodies, by ETag"""
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, etag):
+        with self._lock:
+            body = self._entries.get(etag)
+            if body is not None:
+                self._entries.move_to_end(etag)
+            return body
+
+    def put(self, etag, body):
+        with self._lock:
+            self._entries[etag] = body
+            self._entries.move_to_end(etag)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
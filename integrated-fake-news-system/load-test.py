@@ -0,0 +1,366 @@
+"""
+End-to-End Load Test with Local Stub News Providers
+Starts stand-in GNews and RSS servers with configurable latency, error rate and
+feed size, points the app at them, and drives /api/fetch-news/<source> and
+/api/analyze-manual at a fixed concurrency, reporting throughput and latency
+percentiles per route.
+
+Usage:
+    python load-test.py --concurrency 16 --duration 30
+    python load-test.py --stub-latency 200 --stub-error-rate 0.1 --feed-size 20
+    python load-test.py --stubs-only          # serve stubs for an app started separately
+    python load-test.py --target http://127.0.0.1:8000 --duration 60
+
+To test a gunicorn deployment, start the stubs with --stubs-only, start
+gunicorn with the GNEWS_API_URL and RSS_FEEDS values it prints, then run
+the load with --target.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+from xml.sax.saxutils import escape
+
+import requests
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+REGIONS = ('karnataka', 'india', 'international')
+FEEDS_PER_REGION = 2
+
+WORDS = (
+    'government minister announced policy budget state district officials report city council '
+    'water supply metro project farmers monsoon election court ruling hospital health scheme '
+    'students university research economy growth market police investigation traffic digital '
+    'shocking exclusive according to sources say study shows breaking secret'
+).split()
+
+SOURCES = ['Reuters', 'BBC News', 'The Hindu', 'Times of India', 'NDTV', 'Viral News Daily', 'Unknown Blog']
+
+MANUAL_TEXTS = [
+    "According to Reuters, the state cabinet approved the new metro line budget on Monday.",
+    "SHOCKING!!! Doctors hate this one weird trick that cures everything overnight!",
+    "Study shows monsoon rainfall was eight percent above normal across Karnataka this year.",
+    "Exclusive: secret documents exposed, sources say the minister knew everything.",
+]
+
+
+class StubSettings:
+    """Behaviour shared by both stub providers, adjustable while they run"""
+
+    def __init__(self, latency_ms=50, jitter_ms=0, error_rate=0.0, feed_size=10, fresh_content=False, seed=7):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.feed_size = feed_size
+        self.fresh_content = fresh_content
+        self.rng = random.Random(seed)
+        self.requests = 0
+        self.lock = threading.Lock()
+
+    def next_request(self):
+        """Count a request; returns (delay in seconds, whether to fail it, content generation)"""
+        with self.lock:
+            self.requests += 1
+            delay = (self.latency_ms + self.rng.uniform(-self.jitter_ms, self.jitter_ms)) / 1000
+            fail = self.rng.random() < self.error_rate
+            # With fresh content every response has new articles, so caches never help
+            generation = self.requests if self.fresh_content else 0
+        return max(0.0, delay), fail, generation
+
+
+def _stub_article(key, index, generation):
+    rng = random.Random(f"{key}:{index}:{generation}")
+    title = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(6, 12))).capitalize()
+    body = ' '.join(rng.choice(WORDS) for _ in range(rng.randint(40, 120))) + '.'
+    return {
+        'title': title,
+        'description': body[:160],
+        'content': body,
+        'url': f"https://stub.example/{key}/{generation}/{index}",
+        'source': rng.choice(SOURCES),
+        'published': time.time() - index * 600
+    }
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """
+    /api/v4/search?q=...&max=N     GNews-style JSON
+    /rss/<region>/<feed>.xml       RSS 2.0 feed
+    """
+
+    settings = None  # StubSettings, set by start_stub_server
+
+    def do_GET(self):
+        delay, fail, generation = self.settings.next_request()
+        time.sleep(delay)
+
+        if fail:
+            self._send(503, 'text/plain', b'stub failure')
+            return
+
+        url = urlsplit(self.path)
+        if url.path == '/api/v4/search':
+            params = parse_qs(url.query)
+            query = params.get('q', [''])[0]
+            count = min(int(params.get('max', [10])[0]), self.settings.feed_size)
+            self._send(200, 'application/json', self._gnews_body(query, count, generation))
+        elif url.path.startswith('/rss/'):
+            self._send(200, 'application/rss+xml', self._rss_body(url.path, generation))
+        else:
+            self._send(404, 'text/plain', b'not found')
+
+    def _gnews_body(self, query, count, generation):
+        articles = [_stub_article(query, index, generation) for index in range(count)]
+        return json.dumps({
+            'totalArticles': len(articles),
+            'articles': [
+                {
+                    'title': article['title'],
+                    'description': article['description'],
+                    'content': article['content'],
+                    'url': article['url'],
+                    'publishedAt': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(article['published'])),
+                    'source': {'name': article['source'], 'url': 'https://stub.example'}
+                }
+                for article in articles
+            ]
+        }).encode('utf-8')
+
+    def _rss_body(self, path, generation):
+        items = []
+        for index in range(self.settings.feed_size):
+            article = _stub_article(path, index, generation)
+            items.append(
+                f"<item><title>{escape(article['title'])}</title>"
+                f"<link>{article['url']}</link><guid>{article['url']}</guid>"
+                f"<description>{escape(article['content'])}</description>"
+                f"<pubDate>{formatdate(article['published'], usegmt=True)}</pubDate></item>"
+            )
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>'
+            f"<title>Stub Feed {escape(path)}</title><link>https://stub.example</link>"
+            f"{''.join(items)}</channel></rss>"
+        ).encode('utf-8')
+
+    def _send(self, status, content_type, body):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass  # keep the report readable
+
+
+def start_stub_server(settings, port=0):
+    """Serve both stub providers from one threaded server; returns (server, base URL)"""
+    handler = type('BoundStubHandler', (StubHandler,), {'settings': settings})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name='stub-provider', daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def stub_environment(base_url):
+    """Environment that points NewsAPIClient at the stub providers"""
+    return {
+        'GNEWS_API_URL': f"{base_url}/api/v4/search",
+        'RSS_FEEDS': json.dumps({
+            region: [f"{base_url}/rss/{region}/{feed}.xml" for feed in range(FEEDS_PER_REGION)]
+            for region in REGIONS
+        })
+    }
+
+
+def start_app_server(env, port=0):
+    """Import the app with the stub environment and serve it on a threaded WSGI server"""
+    from werkzeug.serving import make_server
+
+    os.environ.update(env)
+    sys.path.insert(0, HERE)
+    spec = importlib.util.spec_from_file_location('enhanced_news_api_app', os.path.join(HERE, 'enhanced-news-api-app.py'))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['enhanced_news_api_app'] = module
+    spec.loader.exec_module(module)
+
+    server = make_server('127.0.0.1', port, module.app, threaded=True)
+    threading.Thread(target=server.serve_forever, name='app-server', daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def parse_mix(text):
+    """'fetch=1,manual=3' -> [('fetch', 1.0), ('manual', 3.0)]"""
+    mix = []
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name not in ('fetch', 'manual'):
+            raise ValueError(f"Unknown route in mix: {name}")
+        mix.append((name, float(weight or 1)))
+    return mix
+
+
+def run_load(target, concurrency, duration, mix, seed=7):
+    """Send requests from `concurrency` workers for `duration` seconds; returns samples"""
+    samples = []  # (route, seconds, ok)
+    samples_lock = threading.Lock()
+    local = threading.local()
+    deadline = time.monotonic() + duration
+    names = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+
+    def worker(worker_id):
+        rng = random.Random(f"{seed}:{worker_id}")
+        session = getattr(local, 'session', None) or requests.Session()
+        local.session = session
+
+        while time.monotonic() < deadline:
+            if rng.choices(names, weights)[0] == 'fetch':
+                route = 'fetch-news'
+                call = lambda: session.get(f"{target}/api/fetch-news/{rng.choice(REGIONS)}", timeout=60)
+            else:
+                route = 'analyze-manual'
+                payload = {'text': f"{rng.choice(MANUAL_TEXTS)} {rng.random()}", 'source': rng.choice(SOURCES)}
+                call = lambda: session.post(f"{target}/api/analyze-manual", json=payload, timeout=60)
+
+            started = time.perf_counter()
+            try:
+                ok = call().status_code == 200
+            except requests.RequestException:
+                ok = False
+            elapsed = time.perf_counter() - started
+
+            with samples_lock:
+                samples.append((route, elapsed, ok))
+
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker, worker_id) for worker_id in range(concurrency)]:
+            future.result()
+
+    return samples, time.monotonic() - started
+
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of already sorted values"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(samples, elapsed):
+    """Per-route and overall throughput and latency percentiles"""
+    routes = {}
+    for route, seconds, ok in samples:
+        routes.setdefault(route, []).append((seconds, ok))
+    routes['all'] = [(seconds, ok) for _, seconds, ok in samples]
+
+    summary = {}
+    for route, values in routes.items():
+        latencies = sorted(seconds for seconds, _ in values)
+        summary[route] = {
+            'requests': len(values),
+            'errors': sum(1 for _, ok in values if not ok),
+            'throughput_rps': len(values) / elapsed if elapsed else 0.0,
+            'p50_ms': percentile(latencies, 0.50) * 1000,
+            'p95_ms': percentile(latencies, 0.95) * 1000,
+            'p99_ms': percentile(latencies, 0.99) * 1000,
+            'max_ms': (latencies[-1] if latencies else 0.0) * 1000
+        }
+    return summary
+
+
+def print_summary(summary, args, stub_settings):
+    print(f"Concurrency {args.concurrency}, {args.duration}s, mix {args.mix}")
+    if stub_settings:
+        print(f"Stubs: {stub_settings.latency_ms}ms +/- {stub_settings.jitter_ms}ms latency, "
+              f"{stub_settings.error_rate:.0%} errors, {stub_settings.feed_size} articles per response, "
+              f"{stub_settings.requests} upstream requests served")
+    print(f"{'route':<16}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    print('-' * 84)
+    for route, row in summary.items():
+        print(f"{route:<16}{row['requests']:>10}{row['errors']:>8}{row['throughput_rps']:>10.1f}"
+              f"{row['p50_ms']:>10.1f}{row['p95_ms']:>10.1f}{row['p99_ms']:>10.1f}{row['max_ms']:>10.1f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--concurrency', type=int, default=8, help='simultaneous clients (default: 8)')
+    parser.add_argument('--duration', type=float, default=20, help='seconds to send load (default: 20)')
+    parser.add_argument('--mix', default='fetch=1,manual=3', help='route weights (default: fetch=1,manual=3)')
+    parser.add_argument('--target', help='base URL of an app that is already running; default starts one in-process')
+    parser.add_argument('--stub-latency', type=float, default=50, help='stub response latency in ms (default: 50)')
+    parser.add_argument('--stub-jitter', type=float, default=0, help='+/- random latency in ms (default: 0)')
+    parser.add_argument('--stub-error-rate', type=float, default=0.0, help='fraction of stub responses that are 503s')
+    parser.add_argument('--feed-size', type=int, default=10, help='articles per GNews response and RSS feed (default: 10)')
+    parser.add_argument('--fresh-content', action='store_true', help='new articles on every stub response')
+    parser.add_argument('--stub-port', type=int, default=0, help='port for the stub providers (default: any free port)')
+    parser.add_argument('--stubs-only', action='store_true', help='only serve the stubs until interrupted')
+    parser.add_argument('--no-cache', action='store_true', help='disable the region cache in the in-process app')
+    parser.add_argument('--json', metavar='PATH', help='also write the summary as JSON')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+
+    stub_settings = None
+    target = args.target
+    if not target or args.stubs_only:
+        stub_settings = StubSettings(
+            latency_ms=args.stub_latency,
+            jitter_ms=args.stub_jitter,
+            error_rate=args.stub_error_rate,
+            feed_size=args.feed_size,
+            fresh_content=args.fresh_content,
+            seed=args.seed
+        )
+        stub_server, stub_url = start_stub_server(stub_settings, args.stub_port)
+        env = stub_environment(stub_url)
+
+        if args.stubs_only:
+            print(f"Stub providers on {stub_url}; start the app with:")
+            for key, value in env.items():
+                print(f"  export {key}='{value}'")
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                stub_server.shutdown()
+            return 0
+
+        env.update({
+            'ARTICLES_DB': os.path.join(tempfile.mkdtemp(prefix='fake-news-load-'), 'articles.db'),
+            'INGESTION_ENABLED': '0'
+        })
+        if args.no_cache:
+            env.update({'NEWS_CACHE_TTL': '0', 'NEWS_CACHE_MAX_STALE': '0'})
+        _, target = start_app_server(env)
+
+    samples, elapsed = run_load(target.rstrip('/'), args.concurrency, args.duration, mix, args.seed)
+    summary = summarize(samples, elapsed)
+    print_summary(summary, args, stub_settings)
+
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({'settings': vars(args), 'summary': summary}, f, indent=2)
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
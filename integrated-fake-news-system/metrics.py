@@ -0,0 +1,300 @@
+"""
+In-Process Metrics in the Prometheus Text Format
+Counters and histograms cheap enough to record on every request and analysis stage.
+With a shared directory, every process publishes its values there and /metrics
+renders the sum over all of them, like prometheus_client's multiprocess mode.
+"""
+
+import glob
+import json
+import math
+import os
+import threading
+import time
+from bisect import bisect_left
+
+# Seconds, from sub-millisecond analysis stages up to upstream timeouts
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(names, values, extra=()):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    pairs.extend(f'{name}="{_escape(value)}"' for name, value in extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value):
+    if value == math.inf:
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class _Metric:
+    """A named metric with one child per combination of label values"""
+
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+
+    def labels(self, **labels):
+        """The child for these label values; keep it to skip the lookup on hot paths"""
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.get(key)
+                if child is None:
+                    child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def snapshot(self):
+        """[label values, state] of every child, for publishing to other processes"""
+        with self._lock:
+            children = list(self._children.items())
+        return [[list(values), child.state()] for values, child in children]
+
+    def merged(self, snapshots):
+        """Children summing the published states of every process"""
+        children = {}
+        for snapshot in snapshots:
+            for values, state in snapshot:
+                key = tuple(values)
+                child = children.get(key)
+                if child is None:
+                    child = children[key] = self._new_child()
+                child.merge(state)
+        return children
+
+    def reset(self):
+        """
+        Zero every child in place; called in a freshly forked child, so locks are
+        recreated rather than taken. Children bound at import keep recording.
+        """
+        self._lock = threading.Lock()
+        for child in self._children.values():
+            child.reset()
+
+    def render(self, children=None):
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        if children is None:
+            with self._lock:
+                children = dict(self._children)
+        for values, child in sorted(children.items()):
+            lines.extend(child.render(self.name, self.labelnames, values))
+        return lines
+
+
+class _CounterChild:
+    __slots__ = ('_value', '_lock')
+
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1):
+        with self._lock:
+            self._value += amount
+
+    def state(self):
+        return self._value
+
+    def reset(self):
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def merge(self, state):
+        with self._lock:
+            self._value += state
+
+    def render(self, name, labelnames, values):
+        return [f"{name}_total{_format_labels(labelnames, values)} {_format_value(self._value)}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, exposed as <name>_total"""
+
+    kind = 'counter'
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount=1, **labels):
+        self.labels(**labels).inc(amount)
+
+
+class _HistogramChild:
+    __slots__ = ('_buckets', '_counts', '_sum', '_lock')
+
+    def __init__(self, buckets):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)  # last slot counts values above every bound
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        index = bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def state(self):
+        with self._lock:
+            return [list(self._counts), self._sum]
+
+    def reset(self):
+        self._counts = [0] * (len(self._buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def merge(self, state):
+        counts, total = state
+        if len(counts) != len(self._counts):
+            return  # published with other bucket bounds, by an older build
+        with self._lock:
+            self._counts = [mine + theirs for mine, theirs in zip(self._counts, counts)]
+            self._sum += total
+
+    def render(self, name, labelnames, values):
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self._buckets + (math.inf,), counts):
+            cumulative += count
+            lines.append(
+                f"{name}_bucket{_format_labels(labelnames, values, [('le', _format_value(float(bound)))])} {cumulative}"
+            )
+        lines.append(f"{name}_sum{_format_labels(labelnames, values)} {_format_value(total)}")
+        lines.append(f"{name}_count{_format_labels(labelnames, values)} {cumulative}")
+        return lines
+
+
+class Histogram(_Metric):
+    """Distribution of observed values over fixed upper bounds"""
+
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value, **labels):
+        self.labels(**labels).observe(value)
+
+
+class MetricsRegistry:
+    """
+    The set of metrics a process records. With multiprocess_dir, each process
+    writes its values to <dir>/<pid>.json every publish_interval seconds (after
+    start_publishing) and render() sums the files of every process.
+    """
+
+    def __init__(self, multiprocess_dir=None, publish_interval=5.0):
+        self._metrics = []
+        self._lock = threading.Lock()
+        self.multiprocess_dir = multiprocess_dir
+        self.publish_interval = publish_interval
+        self._publisher_pid = None
+        self._publish_lock = threading.Lock()  # the publisher thread and render() both write the file
+
+        if multiprocess_dir:
+            os.makedirs(multiprocess_dir, exist_ok=True)
+            # A forked worker starts from zero; the parent's own values are not its to publish
+            os.register_at_fork(after_in_child=self._reset)
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def register(self, metric):
+        """Add a metric built outside the registry, so it is rendered and published with the rest"""
+        with self._lock:
+            if any(existing.name == metric.name for existing in self._metrics):
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics.append(metric)
+        return metric
+
+    def _reset(self):
+        self._lock = threading.Lock()
+        self._publish_lock = threading.Lock()
+        for metric in self._metrics:
+            metric.reset()
+
+    def publish(self):
+        """Write this process's values to the shared directory"""
+        with self._lock:
+            metrics = list(self._metrics)
+        data = {metric.name: metric.snapshot() for metric in metrics}
+
+        path = os.path.join(self.multiprocess_dir, f"{os.getpid()}.json")
+        with self._publish_lock:
+            with open(path + '.tmp', 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(path + '.tmp', path)  # readers never see a half-written file
+
+    def start_publishing(self):
+        """Publish periodically from this process; a no-op without a directory or when already running"""
+        with self._lock:
+            if not self.multiprocess_dir or self._publisher_pid == os.getpid():
+                return
+            self._publisher_pid = os.getpid()
+
+        def run():
+            while True:
+                try:
+                    self.publish()
+                except OSError:
+                    pass  # directory removed or full; try again next interval
+                time.sleep(self.publish_interval)
+
+        threading.Thread(target=run, name='metrics-publisher', daemon=True).start()
+
+    def _published(self):
+        """Every process's published values: {metric name: [snapshot, ...]}"""
+        self.publish()  # include this process's latest values
+        published = {}
+        for path in glob.glob(os.path.join(self.multiprocess_dir, '*.json')):
+            try:
+                with open(path, encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            for name, snapshot in data.items():
+                published.setdefault(name, []).append(snapshot)
+        return published
+
+    def render(self):
+        """Every metric in the Prometheus text exposition format (version 0.0.4)"""
+        with self._lock:
+            metrics = list(self._metrics)
+        published = self._published() if self.multiprocess_dir else None
+
+        lines = []
+        for metric in metrics:
+            if published is None:
+                lines.extend(metric.render())
+            else:
+                lines.extend(metric.render(metric.merged(published.get(metric.name, ()))))
+        return '\n'.join(lines) + '\n'
+
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
@@ -0,0 +1,159 @@
+"""
+On-Demand Request Profiling
+Stage-timing traces and cProfile captures for single requests, kept in SQLite for download
+"""
+
+import contextvars
+import cProfile
+import io
+import json
+import marshal
+import os
+import pstats
+import secrets
+import sqlite3
+import threading
+import time
+
+# The trace of the request being profiled in this context, if any
+_active_trace = contextvars.ContextVar('active_trace', default=None)
+
+
+class StageTrace:
+    """Timed spans recorded while one request runs, from any thread it hands work to"""
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.spans = []
+        self._lock = threading.Lock()
+
+    def add(self, name, seconds, attrs):
+        end = time.perf_counter() - self.started
+        with self._lock:
+            self.spans.append({
+                'name': name,
+                'start_ms': round((end - seconds) * 1000, 3),
+                'duration_ms': round(seconds * 1000, 3),
+                'thread': threading.current_thread().name,
+                **attrs
+            })
+
+    def summary(self):
+        """Total time and count per span name, slowest first"""
+        totals = {}
+        with self._lock:
+            spans = list(self.spans)
+        for span in spans:
+            entry = totals.setdefault(span['name'], {'count': 0, 'total_ms': 0.0})
+            entry['count'] += 1
+            entry['total_ms'] = round(entry['total_ms'] + span['duration_ms'], 3)
+        return dict(sorted(totals.items(), key=lambda item: -item[1]['total_ms']))
+
+    def to_dict(self):
+        with self._lock:
+            spans = sorted(self.spans, key=lambda span: span['start_ms'])
+        return {
+            'total_ms': round((time.perf_counter() - self.started) * 1000, 3),
+            'summary': self.summary(),
+            'spans': spans
+        }
+
+
+def start_trace():
+    """Begin a stage trace for the current request; returns (trace, token to end it with)"""
+    trace = StageTrace()
+    return trace, _active_trace.set(trace)
+
+
+def end_trace(token):
+    _active_trace.reset(token)
+
+
+def record_span(name, seconds, **attrs):
+    """Add a span to the current request's trace; a no-op unless the request is being traced"""
+    trace = _active_trace.get()
+    if trace is not None:
+        trace.add(name, seconds, attrs)
+
+
+def propagate(fn):
+    """Wrap fn so a thread pool runs it inside the current trace; unchanged when not tracing"""
+    if _active_trace.get() is None:
+        return fn
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
+
+
+def start_cprofile():
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def cprofile_report(profiler, limit=40, sort='cumulative'):
+    """The profile as a pstats text table, plus its raw marshalled stats"""
+    profiler.disable()
+    stream = io.StringIO()
+    stats = pstats.Stats(profiler, stream=stream)
+    stats.sort_stats(sort).print_stats(limit)
+    profiler.create_stats()
+    return stream.getvalue(), marshal.dumps(profiler.stats)
+
+
+class ProfileStore:
+    """
+    The most recent captured profiles, by ID. They are kept in SQLite, so the
+    follow-up download works whichever worker process answers it.
+    """
+
+    def __init__(self, db_path, max_entries=20):
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute('''
+                CREATE TABLE IF NOT EXISTS request_profiles (
+                    profile_id TEXT PRIMARY KEY,
+                    created REAL NOT NULL,
+                    profile TEXT NOT NULL,
+                    pstats BLOB
+                )
+            ''')
+
+    def _connect(self):
+        """Return this thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        # A connection must not cross a fork, e.g. the schema setup done in a preloading parent
+        if conn is None or self._local.pid != os.getpid():
+            conn = sqlite3.connect(self.db_path, timeout=10)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def put(self, profile):
+        profile_id = secrets.token_hex(8)
+        fields = {key: value for key, value in profile.items() if key != 'pstats'}
+        with self._connect() as conn:
+            conn.execute(
+                'INSERT INTO request_profiles (profile_id, created, profile, pstats) VALUES (?, ?, ?, ?)',
+                (profile_id, time.time(), json.dumps(fields), profile.get('pstats'))
+            )
+            conn.execute(
+                '''DELETE FROM request_profiles WHERE profile_id NOT IN (
+                    SELECT profile_id FROM request_profiles ORDER BY created DESC LIMIT ?
+                )''',
+                (self.max_entries,)
+            )
+        return profile_id
+
+    def get(self, profile_id):
+        row = self._connect().execute(
+            'SELECT profile, pstats FROM request_profiles WHERE profile_id = ?', (profile_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        profile = json.loads(row[0])
+        if row[1] is not None:
+            profile['pstats'] = row[1]
+        return profile
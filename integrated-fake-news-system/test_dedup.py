@@ -0,0 +1,128 @@
+"""
+Near-duplicate detection on syndicated copies of wire stories, as the GNews and
+RSS providers return them: the same agency copy under different headlines,
+publisher suffixes, trimmed or lightly edited bodies, and tracking URLs
+"""
+
+import pytest
+
+from articles import Article
+from dedup import DuplicateIndex, normalize_url, strip_publisher
+
+# (first copy, second copy) of one story from two outlets
+SYNDICATED_PAIRS = [
+    (
+        Article(
+            title='RBI keeps repo rate unchanged at 6.5 per cent for eighth time in a row - NDTV',
+            content=(
+                'The Reserve Bank of India on Friday kept the key repo rate unchanged at 6.5 per cent '
+                'for the eighth consecutive time, and retained its focus on withdrawal of accommodation. '
+                'Governor Shaktikanta Das said the six-member monetary policy committee voted 4:2 to keep '
+                'the rate unchanged. The central bank projected GDP growth at 7.2 per cent for the current fiscal.'
+            ),
+            url='https://www.ndtv.com/business/rbi-policy-repo-rate-unchanged-6-5-per-cent?utm_source=rss'
+        ),
+        Article(
+            title='RBI keeps repo rate unchanged at 6.5% for eighth time in a row | Business Standard',
+            content=(
+                'The Reserve Bank of India (RBI) on Friday kept the key repo rate unchanged at 6.5 per cent '
+                'for the eighth consecutive time and retained its focus on withdrawal of accommodation. '
+                'RBI Governor Shaktikanta Das said the six-member monetary policy committee (MPC) voted 4:2 '
+                'to keep the rate unchanged. The central bank projected GDP growth at 7.2 per cent for the '
+                'current fiscal year.'
+            ),
+            url='https://www.business-standard.com/economy/news/rbi-keeps-repo-rate-unchanged'
+        ),
+    ),
+    (
+        Article(
+            title='Heavy rain lashes Bengaluru, waterlogging in several areas; IMD issues yellow alert',
+            content=(
+                'Heavy rain lashed several parts of Bengaluru on Tuesday evening, leading to waterlogging '
+                'and traffic snarls in many areas. The India Meteorological Department has issued a yellow '
+                'alert for the city for the next two days, forecasting thunderstorms with lightning. '
+                'Trees were uprooted in Jayanagar and Malleswaram, the BBMP said.'
+            ),
+            url='https://timesofindia.indiatimes.com/city/bengaluru/heavy-rain-lashes-bengaluru/articleshow/1.cms'
+        ),
+        Article(
+            title='Bengaluru rains: Heavy rain lashes city, waterlogging in several areas - The Hindu',
+            content=(
+                'Heavy rain lashed several parts of Bengaluru on Tuesday evening, leading to waterlogging '
+                'and traffic snarls in many areas. The India Meteorological Department (IMD) has issued a '
+                'yellow alert for the city for the next two days, forecasting thunderstorms with lightning.'
+            ),
+            url='https://www.thehindu.com/news/cities/bangalore/bengaluru-rains-heavy-rain/article1.ece'
+        ),
+    ),
+    (
+        Article(
+            title='WHO declares mpox outbreak a global public health emergency',
+            content=(
+                'The World Health Organization on Wednesday declared the mpox outbreak in Congo and neighbouring '
+                'countries a global public health emergency, after a new strain of the virus spread. '
+                'WHO Director-General Tedros Adhanom Ghebreyesus said the potential for further spread within '
+                'Africa and beyond is very worrying.'
+            ),
+            url='https://www.reuters.com/business/healthcare-pharmaceuticals/who-declares-mpox-emergency-2024-08-14/'
+        ),
+        Article(
+            title='WHO declares mpox outbreak a global public health emergency - Reuters',
+            content=(
+                'The World Health Organization on Wednesday declared the mpox outbreak in Congo and neighbouring '
+                'countries a global public health emergency, after a new strain of the virus spread.'
+            ),
+            url='https://news.google.com/rss/articles/CBMiX2h0dHBzOi8vd3d3LnJldXRlcnMuY29t'
+        ),
+    ),
+]
+
+# Different stories from the same beat, which must all be kept
+DISTINCT_STORIES = [
+    Article(
+        title='RBI cuts repo rate by 25 basis points to 6.25 per cent',
+        content='The Reserve Bank of India on Friday cut the repo rate by 25 basis points to 6.25 per cent, '
+                'its first cut in nearly five years, as inflation eased.',
+        url='https://example.com/rbi-cuts-rate'
+    ),
+    Article(
+        title='Bengaluru records hottest April day in a decade',
+        content='Bengaluru recorded a maximum temperature of 38.5 degrees Celsius on Sunday, the hottest April '
+                'day in a decade, the India Meteorological Department said.',
+        url='https://example.com/bengaluru-heat'
+    ),
+    Article(
+        title='WHO says mpox is no longer a global health emergency',
+        content='The World Health Organization said on Thursday that mpox is no longer a global health '
+                'emergency, as cases have declined steadily for months.',
+        url='https://example.com/mpox-emergency-over'
+    ),
+]
+
+
+@pytest.mark.parametrize('first, second', SYNDICATED_PAIRS)
+def test_syndicated_copies_are_collapsed(first, second):
+    index = DuplicateIndex()
+    assert index.add(first)
+    assert not index.add(second)
+
+
+def test_distinct_stories_are_kept():
+    index = DuplicateIndex()
+    for first, _ in SYNDICATED_PAIRS:
+        assert index.add(first)
+    for article in DISTINCT_STORIES:
+        assert index.add(article)
+
+
+def test_tracking_parameters_do_not_change_the_url_key():
+    assert normalize_url('https://www.ndtv.com/a/story/amp?utm_source=rss&fbclid=x') == 'ndtv.com/a/story'
+
+
+@pytest.mark.parametrize('title, expected', [
+    ('WHO declares mpox a global emergency - Reuters', 'WHO declares mpox a global emergency'),
+    ('RBI keeps repo rate unchanged | Business Standard', 'RBI keeps repo rate unchanged'),
+    ('Covid-19 cases rise in Kerala', 'Covid-19 cases rise in Kerala'),
+])
+def test_publisher_suffix_is_stripped(title, expected):
+    assert strip_publisher(title) == expected
@@ -0,0 +1,88 @@
+"""
+FastSentimentAnalyzer must score every text as vaderSentiment does, on
+hand-picked cases for each VADER rule and on generated articles built from
+shared sentences, like syndicated wire copy
+"""
+
+import random
+
+import pytest
+from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+
+from fast_sentiment import FastSentimentAnalyzer
+
+TOLERANCE = 1e-9
+
+# (rule exercised, text)
+SAMPLE_TEXTS = [
+    ('empty', ""),
+    ('neutral', "The Karnataka government approved the new metro line on Monday."),
+    ('punctuation emphasis', "VADER is smart, handsome, and funny!"),
+    ('all caps', "VADER is VERY SMART, handsome, and FUNNY!!!"),
+    ('but', "The plot was good, but the characters are uncompelling and the dialog is not great."),
+    ('all caps slang', "Today SUX!"),
+    ('negation', "Not bad at all"),
+    ('negation', "At least it isn't a horrible book."),
+    ('negation', "No, I don't think this is the bomb. It's the shit, yeah right."),
+    ('negation', "The minister said: 'no problem' -- according to sources. no good, no bad, no or nor happy."),
+    ('emoticons', "Make sure you :) or :D today!"),
+    ('emoji', "Catch utf-8 emoji such as 💘 and 💋 and 😁"),
+    ('emoji', "Fans 😁 cheered the win 💘 but the coach was not happy 😢"),
+    ('boosters', "The food here is kind of good. It was never so good before. Without doubt the best."),
+    ('question marks', "Officials said the decision was not unexpected. Critics called it a disaster??"),
+    ('but', "Prices rose sharply. Investors were extremely worried but markets recovered slightly."),
+]
+
+_VOCABULARY = (
+    "the government announced a new policy on monday according to officials who said plan will "
+    "good great terrible bad happy sad love hate not never no nor or but very extremely slightly "
+    "kind of sort just enough least at without doubt so this bomb shit yeah right kiss death die "
+    "for beating heart GOOD TERRIBLE VERY isn't don't wasn't cannot 😁 💘 :) ! ? . , -- "
+    "Bengaluru Karnataka SHOCKING secret exposed disaster win wins lost"
+).split()
+
+
+def generated_corpus(samples=2000, seed=7):
+    rng = random.Random(seed)
+    sentences = [
+        ' '.join(rng.choice(_VOCABULARY) for _ in range(rng.randint(1, 14))) + rng.choice(['.', '!', '?', ''])
+        for _ in range(max(1, samples // 4))
+    ]
+    # Articles built from shared sentences, so sentence cache hits are exercised too
+    return [
+        ' '.join(rng.choice(sentences) for _ in range(rng.randint(1, 8)))
+        for _ in range(samples)
+    ]
+
+
+@pytest.fixture(scope='module')
+def vader():
+    return SentimentIntensityAnalyzer()
+
+
+@pytest.fixture
+def fast(vader):
+    return FastSentimentAnalyzer(analyzer=vader)
+
+
+def assert_same_scores(vader, fast, text):
+    expected = vader.polarity_scores(text)
+    actual = fast.polarity_scores(text)
+    assert actual['compound'] == pytest.approx(expected['compound'], abs=TOLERANCE), text
+    assert actual == pytest.approx(expected, abs=TOLERANCE), text
+
+
+@pytest.mark.parametrize('rule, text', SAMPLE_TEXTS)
+def test_sample_texts_match_vader(vader, fast, rule, text):
+    assert_same_scores(vader, fast, text)
+
+
+def test_generated_corpus_matches_vader(vader, fast):
+    corpus = generated_corpus()
+    for text in corpus:
+        assert_same_scores(vader, fast, text)
+
+    # Scored again, now mostly from the sentence cache
+    for text in corpus:
+        assert_same_scores(vader, fast, text)
+    assert fast.hits > 0
@@ -0,0 +1,45 @@
+"""
+Multiprocess metrics: a forked worker starts from zero but keeps recording
+through the label children bound at import, and /metrics sums every process
+"""
+
+import os
+
+import pytest
+
+from metrics import Counter, Histogram, MetricsRegistry
+
+
+@pytest.mark.skipif(not hasattr(os, 'fork'), reason='needs os.fork')
+def test_forked_worker_records_through_children_bound_at_import(tmp_path):
+    registry = MetricsRegistry(multiprocess_dir=str(tmp_path))
+    analyzed = registry.register(Counter('articles_analyzed', 'Articles analyzed', ('result',)))
+    stages = registry.register(Histogram('stage_seconds', 'Stage time', ('stage',), buckets=(0.01, 0.1)))
+
+    # Bound once at import, like detector.ANALYZED_COMPUTED and STAGE_TIMERS
+    computed = analyzed.labels(result='computed')
+    sentiment = stages.labels(stage='sentiment')
+
+    computed.inc(2)
+    sentiment.observe(0.005)
+
+    pid = os.fork()
+    if pid == 0:
+        status = 1
+        try:
+            computed.inc(3)
+            sentiment.observe(0.05)
+            registry.publish()
+            status = 0
+        finally:
+            os._exit(status)
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+
+    lines = registry.render().splitlines()
+
+    # The worker's own 3 and 1 observation, not the 2 and 1 it inherited, plus the parent's
+    assert 'articles_analyzed_total{result="computed"} 5' in lines
+    assert 'stage_seconds_count{stage="sentiment"} 2' in lines
+    assert 'stage_seconds_bucket{stage="sentiment",le="0.01"} 1' in lines
+    assert 'stage_seconds_bucket{stage="sentiment",le="0.1"} 2' in lines
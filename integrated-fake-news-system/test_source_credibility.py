@@ -0,0 +1,74 @@
+"""
+The compiled source credibility index must give the same score as the
+_assess_source_credibility function it replaced, for every source string
+"""
+
+import os
+import random
+
+import pytest
+
+from detector import SourceCredibilityIndex
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def legacy_credibility(source):
+    """_assess_source_credibility as it was before the index, table and all"""
+    if not source:
+        return 0.5
+
+    source_lower = source.lower()
+
+    credible_sources = {
+        'bbc': 0.95, 'reuters': 0.98, 'cnn': 0.90, 'times of india': 0.85,
+        'the hindu': 0.90, 'indian express': 0.85, 'deccan herald': 0.80,
+        'press information bureau': 0.95, 'pib': 0.95
+    }
+    suspicious_indicators = ['fake', 'conspiracy', 'hoax', 'clickbait']
+
+    for credible, score in credible_sources.items():
+        if credible in source_lower:
+            return score
+
+    if any(indicator in source_lower for indicator in suspicious_indicators):
+        return 0.2
+
+    return 0.6
+
+
+FRAGMENTS = [
+    'BBC', 'bbc news', 'Reuters', 'CNN', 'cnn-ibn', 'Times of India', 'The Hindu', 'Hindu',
+    'Indian Express', 'The New Indian Express', 'Deccan Herald', 'Press Information Bureau', 'PIB',
+    'PIB India', 'fake', 'Conspiracy', 'HOAX', 'clickbait', 'Daily', 'World', 'Post', 'News',
+    'tribune', 'pi', 'reuter', 'times', 'of', 'india', '', ' ', '-', '|'
+]
+
+KNOWN_SOURCES = [
+    None, '', 'BBC News', 'Reuters', 'CNN', 'Times of India', 'The Times of India', 'The Hindu',
+    'The Hindu BusinessLine', 'Indian Express', 'The New Indian Express', 'Deccan Herald',
+    'Press Information Bureau', 'PIB', 'pibindia', 'Fake News Daily', 'Hoax Busters', 'Clickbait Central',
+    'Conspiracy Times', 'CNN fake news watch', 'Reuters via BBC', 'BBC via Reuters', 'NDTV', 'Unknown',
+    'Times Now', 'Hindustan Times', 'Deccan Chronicle'
+]
+
+
+@pytest.fixture(scope='module')
+def index():
+    return SourceCredibilityIndex.from_file(os.path.join(HERE, 'source-credibility.json'))
+
+
+@pytest.mark.parametrize('source', KNOWN_SOURCES)
+def test_known_sources_match_the_legacy_function(index, source):
+    assert index.score(source) == legacy_credibility(source)
+
+
+def test_random_sources_match_the_legacy_function(index):
+    rng = random.Random(8)
+    for _ in range(5000):
+        source = rng.choice(['', ' ', '-']).join(rng.choice(FRAGMENTS) for _ in range(rng.randint(1, 4)))
+        if rng.random() < 0.3:
+            source = source.upper()
+        assert index.score(source) == legacy_credibility(source), source
+        # A memoized answer is the same answer
+        assert index.score(source) == legacy_credibility(source), source
@@ -0,0 +1,35 @@
+"""
+LexiconMatcher must count every phrase occurrence, including phrases that are
+prefixes of longer phrases matched at the same position
+"""
+
+import random
+
+from text_features import LexiconMatcher
+
+
+def brute_force_counts(phrases, text):
+    return {
+        phrase: sum(text.startswith(phrase, start) for start in range(len(text)))
+        for phrase in phrases
+        if text.count(phrase)
+    }
+
+
+def test_prefix_phrases_are_counted():
+    matcher = LexiconMatcher({'words': ['fake', 'fake news', 'fakes', 'news', 'ne']})
+    hits = matcher.scan('fake news and fakes in the news')
+    assert hits.count('fake') == 2
+    assert hits.count('fake news') == 1
+    assert hits.count('fakes') == 1
+    assert hits.count('news') == 2
+    assert hits.count('ne') == 2
+
+
+def test_counts_match_a_brute_force_scan():
+    rng = random.Random(11)
+    for _ in range(200):
+        phrases = sorted({''.join(rng.choices('ab ', k=rng.randint(1, 5))) for _ in range(rng.randint(1, 12))})
+        text = ''.join(rng.choices('ab ', k=rng.randint(0, 60)))
+        hits = LexiconMatcher({'group': phrases}).scan(text)
+        assert {phrase: hits.count(phrase) for phrase in phrases if hits.count(phrase)} == brute_force_counts(phrases, text)
@@ -0,0 +1,178 @@
+"""
+Shared Text Features for the Fake News Detectors
+Keyword rules are compiled once into a single matcher that finds every hit in one pass
+"""
+
+import re
+from collections import Counter
+
+import numpy as np
+
+
+class LexiconMatcher:
+    """
+    Finds every occurrence of a set of phrases in a single pass over the text.
+    Phrases are compiled into one trie-shaped regex, so the scan stays linear in
+    text length however many phrases are added.
+    """
+
+    def __init__(self, groups):
+        # groups: {group name: [phrases]}, phrases are matched as lowercase substrings
+        self.groups = {name: tuple(dict.fromkeys(phrases)) for name, phrases in groups.items()}
+
+        phrases = sorted({phrase for group in self.groups.values() for phrase in group})
+
+        trie = _build_trie(phrases)
+
+        # A phrase that is a prefix of a longer one also occurs wherever the longer one matches;
+        # one walk of the trie finds them, in time linear in the trie size plus the prefixes found
+        self._prefixes = {}
+        _collect_prefixes(trie, [], self._prefixes)
+
+        self._pattern = re.compile(_node_pattern(trie)) if phrases else None
+
+    def scan(self, text_lower):
+        """Count every phrase occurrence in already-lowercased text"""
+        counts = Counter()
+
+        if self._pattern is not None:
+            search = self._pattern.search
+            match = search(text_lower)
+            while match is not None:
+                phrase = match.group()
+                counts[phrase] += 1
+                for prefix in self._prefixes[phrase]:
+                    counts[prefix] += 1
+
+                # Resume one character later so overlapping occurrences are reported too
+                match = search(text_lower, match.start() + 1)
+
+        return LexiconHits(self.groups, counts)
+
+
+class LexiconHits:
+    """
+    Phrase hit counts from one LexiconMatcher scan
+    """
+
+    __slots__ = ('groups', 'counts')
+
+    def __init__(self, groups, counts):
+        self.groups = groups
+        self.counts = counts
+
+    def count(self, phrase):
+        """Occurrences of a single phrase"""
+        return self.counts.get(phrase, 0)
+
+    def distinct(self, group):
+        """Number of different phrases from the group that occur at least once"""
+        return sum(1 for phrase in self.groups[group] if phrase in self.counts)
+
+    def any(self, group):
+        """Whether any phrase from the group occurs"""
+        return any(phrase in self.counts for phrase in self.groups[group])
+
+    def matched(self, group):
+        """Phrases from the group that occur, in group order"""
+        return [phrase for phrase in self.groups[group] if phrase in self.counts]
+
+
+def _build_trie(phrases):
+    """Character trie of the phrases; the '' key of a node holds the phrase ending there"""
+    trie = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = phrase
+
+    return trie
+
+
+def _collect_prefixes(node, ended, prefixes):
+    """Map every phrase below node to the shorter phrases ending on its path (ended, shortest first)"""
+    if '' in node:
+        prefixes[node['']] = list(ended)
+        ended = ended + [node['']]
+    for char, child in node.items():
+        if char != '':
+            _collect_prefixes(child, ended, prefixes)
+
+
+def _node_pattern(node):
+    """Regex alternation shaped like the trie below node, preferring the longest phrase"""
+    branches = [
+        re.escape(char) + _node_pattern(child)
+        for char, child in sorted(node.items())
+        if char != ''
+    ]
+
+    if not branches:
+        return ''
+
+    body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+    # A phrase ends here: the longer continuations are optional (greedy, so longest wins)
+    if '' in node:
+        return '(?:' + body + ')?'
+
+    return body
+
+
+_BMP_UPPERCASE = None
+
+
+def _bmp_uppercase_table():
+    """Boolean lookup of str.isupper() for every Basic Multilingual Plane code point"""
+    global _BMP_UPPERCASE
+    if _BMP_UPPERCASE is None:
+        _BMP_UPPERCASE = np.array([chr(code).isupper() for code in range(0x10000)], dtype=bool)
+    return _BMP_UPPERCASE
+
+
+def load_tables():
+    """Build the lookup tables that are otherwise built on first use"""
+    _bmp_uppercase_table()
+
+
+def char_count_features(texts):
+    """
+    Count exclamation marks and uppercase characters, and measure the length of each
+    text, with vectorized arithmetic over the code points of the whole batch.
+    Returns three int64 arrays: (exclamations, uppercase, lengths).
+    """
+    lengths = np.fromiter((len(text) for text in texts), dtype=np.int64, count=len(texts))
+    codepoints = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32)
+
+    is_exclamation = codepoints == ord('!')
+
+    is_upper = np.zeros(len(codepoints), dtype=bool)
+    in_bmp = codepoints < 0x10000
+    is_upper[in_bmp] = _bmp_uppercase_table()[codepoints[in_bmp]]
+    for index in np.flatnonzero(~in_bmp):  # rare astral characters, e.g. emoji
+        is_upper[index] = chr(codepoints[index]).isupper()
+
+    # Per-text sums from running totals at each text boundary
+    bounds = np.concatenate(([0], np.cumsum(lengths)))
+
+    def per_text(mask):
+        running = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+        return running[bounds[1:]] - running[bounds[:-1]]
+
+    return per_text(is_exclamation), per_text(is_upper), lengths
+
+
+# Keyword rules shared by both detectors, compiled once at import
+DETECTOR_LEXICON = LexiconMatcher({
+    # EnhancedFakeNewsDetector (detector.py)
+    'sensational': ['shocking', 'unbelievable', 'breaking', 'exclusive', 'secret', 'exposed'],
+    'attribution': ['according to', 'sources say', 'reported by', 'study shows'],
+    'clickbait': ['you won\'t believe', 'doctors hate', 'one weird trick', 'this will shock you'],
+
+    # ImprovedFakeNewsDetector (enhanced-fake-news-detector.py)
+    'suspicious_language': ['shocking', 'unbelievable', 'secret', 'exposed', 'miracle cure'],
+    'basic_attribution': ['according to', 'sources say', 'study shows'],
+    'credible_outlets': ['bbc', 'cnn', 'reuters', 'nytimes'],
+    'suspicious_outlets': ['fake', 'conspiracy', 'hoax'],
+})
@@ -0,0 +1,20 @@
+"""
+WSGI Entry Point
+Loads enhanced-news-api-app.py (whose name is not importable) for servers like gunicorn:
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+
+import importlib.util
+import os
+import sys
+
+_here = os.path.dirname(os.path.abspath(__file__))
+if _here not in sys.path:
+    sys.path.insert(0, _here)
+
+_spec = importlib.util.spec_from_file_location('enhanced_news_api_app', os.path.join(_here, 'enhanced-news-api-app.py'))
+_module = importlib.util.module_from_spec(_spec)
+sys.modules['enhanced_news_api_app'] = _module  # registered like a normal import, so pickled references resolve
+_spec.loader.exec_module(_module)
+
+app = _module.app